@@ -404,6 +404,29 @@ class StrategyEngine:
         for step_name in step_names:
             self.run_step(target_date, step_name)
 
+    def run_range(self, start_date: datetime, end_date: datetime, step_names: list[StepName]) -> None:
+        """期間内の各iterationで複数ステップを順番に実行する
+
+        start_dateからconfig.loop.frequency間隔でend_date（当日を含む）まで
+        iterationを進め、各日時でrun_steps()を呼び出す。
+
+        Args:
+            start_date: 最初のiteration日時
+            end_date: 最後のiteration日時（含む）
+            step_names: 各iterationで実行するステップ名のリスト
+
+        Raises:
+            ValueError: start_dateがend_dateより後の場合
+        """
+        if start_date > end_date:
+            raise ValueError(f"start_dateはend_date以前である必要があります: {start_date} > {end_date}")
+
+        frequency = self.config.loop.frequency
+        target_date = start_date
+        while target_date <= end_date:
+            self.run_steps(target_date, step_names)
+            target_date += frequency
+
     def load_context(self, target_date: datetime | None = None) -> Context:
         """コンテキストを読み込む
 
@@ -428,3 +451,30 @@ class StrategyEngine:
 
         self._context = context
         return context
+
+    def reset_context(self, target_date: datetime) -> Context:
+        """コンテキストを指定日時の空の状態に初期化する
+
+        既存のContextがある場合は新規生成せず、各要素をクリアして再利用する。
+        そのため、以前のload_context()/reset_context()が返したContextの参照も
+        同一オブジェクトであり、その場でクリアされる点に注意すること。
+        以前の状態を保持したい場合は、呼び出し前に必要な要素を退避すること。
+
+        Args:
+            target_date: 初期化後のcurrent_datetime
+
+        Returns:
+            初期化したContext
+        """
+        if self._context is None:
+            self._context = Context(current_datetime=target_date)
+            return self._context
+
+        context = self._context
+        context.current_datetime = target_date
+        context.signals = None
+        context.portfolio_plan = None
+        context.entry_orders = None
+        context.exit_orders = None
+        context.current_positions = None
+        return context
@@ -9,7 +9,7 @@ contracts/base_data_source.mdを参照。
 
 from abc import ABC, abstractmethod
 from datetime import datetime, timedelta
-from typing import Any
+from typing import Any, TypeVar
 
 import polars as pl
 
@@ -19,6 +19,9 @@ from qeel.config import DataSourceConfig
 # 型ヒントはAnyで代用（006実装後にBaseIOに変更）
 BaseIO = Any
 
+# ヘルパーメソッドはDataFrame/LazyFrameのどちらにも適用できる
+FrameT = TypeVar("FrameT", pl.DataFrame, pl.LazyFrame)
+
 
 class BaseDataSource(ABC):
     """データソース抽象基底クラス
@@ -59,27 +62,30 @@ class BaseDataSource(ABC):
 
     # 共通ヘルパーメソッド（ユーザは必要に応じて利用可能）
 
-    def _normalize_datetime_column(self, df: pl.DataFrame) -> pl.DataFrame:
+    def _normalize_datetime_column(self, df: FrameT) -> FrameT:
         """datetime列を正規化する
 
         config.datetime_columnで指定された列名を"datetime"に変換し、
         型がDatetimeでない場合はキャストする。
+        LazyFrameを渡した場合はスキーマのみを参照し、データは読み込まない。
 
         Args:
-            df: 元のDataFrame
+            df: 元のDataFrameまたはLazyFrame
 
         Returns:
-            datetime列が正規化されたDataFrame
+            datetime列が正規化されたDataFrameまたはLazyFrame（入力と同じ型）
 
         Raises:
             KeyError: config.datetime_columnで指定された列がDataFrameに存在しない場合
         """
         datetime_column = self.config.datetime_column
+        schema = df.collect_schema()
+        columns = schema.names()
 
         # 列が存在するか確認
-        if datetime_column not in df.columns:
+        if datetime_column not in columns:
             raise KeyError(
-                f"datetime_columnで指定された列'{datetime_column}'がDataFrameに存在しません。存在する列: {df.columns}"
+                f"datetime_columnで指定された列'{datetime_column}'がDataFrameに存在しません。存在する列: {columns}"
             )
 
         # すでに"datetime"列名の場合は何もしない
@@ -87,9 +93,10 @@ class BaseDataSource(ABC):
             return df
 
         # 型がDatetimeでない場合はキャストしてリネーム
-        if df[datetime_column].dtype != pl.Datetime:
+        dtype = schema[datetime_column]
+        if dtype != pl.Datetime:
             # 文字列の場合はstr.to_datetimeを使用、それ以外はcastを試行
-            if df[datetime_column].dtype == pl.Utf8:
+            if dtype == pl.Utf8:
                 df = df.with_columns(pl.col(datetime_column).str.to_datetime().alias("datetime")).drop(datetime_column)
             else:
                 df = df.with_columns(pl.col(datetime_column).cast(pl.Datetime).alias("datetime")).drop(datetime_column)
@@ -118,21 +125,23 @@ class BaseDataSource(ABC):
 
     def _filter_by_datetime_and_symbols(
         self,
-        df: pl.DataFrame,
+        df: FrameT,
         start: datetime,
         end: datetime,
         symbols: list[str],
-    ) -> pl.DataFrame:
+    ) -> FrameT:
         """datetime範囲と銘柄でフィルタリングする
 
+        LazyFrameを渡した場合、条件はスキャン時の述語としてプッシュダウンされる。
+
         Args:
-            df: フィルタリング対象のDataFrame
+            df: フィルタリング対象のDataFrameまたはLazyFrame
             start: 開始日時
             end: 終了日時
             symbols: 銘柄コードリスト
 
         Returns:
-            フィルタリング済みのDataFrame
+            フィルタリング済みのDataFrameまたはLazyFrame（入力と同じ型）
         """
         return df.filter(
             (pl.col("datetime") >= start) & (pl.col("datetime") <= end) & (pl.col("symbol").is_in(symbols))
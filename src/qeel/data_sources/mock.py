@@ -72,28 +72,19 @@ class MockDataSource(BaseDataSource):
         Returns:
             デフォルトモックデータのDataFrame
         """
-        # 銘柄ごとにデフォルトデータを生成
+        # 銘柄ごとのループを使わず、銘柄の並び順を価格・出来高のオフセットとして列式で生成
         target_symbols = symbols if symbols else ["AAPL", "GOOG"]
         base_price = 100.0
 
-        data: dict[str, list[datetime | str | float | int]] = {
-            "datetime": [],
-            "symbol": [],
-            "open": [],
-            "high": [],
-            "low": [],
-            "close": [],
-            "volume": [],
-        }
-
-        for i, symbol in enumerate(target_symbols):
-            price_offset = i * 100.0
-            data["datetime"].append(start)
-            data["symbol"].append(symbol)
-            data["open"].append(base_price + price_offset - 1.0)
-            data["high"].append(base_price + price_offset + 1.0)
-            data["low"].append(base_price + price_offset - 2.0)
-            data["close"].append(base_price + price_offset)
-            data["volume"].append(1000 * (i + 1))
-
-        return pl.DataFrame(data)
+        index = pl.int_range(pl.len(), dtype=pl.Int64)
+        close = base_price + index.cast(pl.Float64) * 100.0
+
+        return pl.DataFrame({"symbol": target_symbols}, schema={"symbol": pl.Utf8}).select(
+            pl.lit(start, dtype=pl.Datetime("us")).alias("datetime"),
+            pl.col("symbol"),
+            (close - 1.0).alias("open"),
+            (close + 1.0).alias("high"),
+            (close - 2.0).alias("low"),
+            close.alias("close"),
+            ((index + 1) * 1000).alias("volume"),
+        )
@@ -59,29 +59,46 @@ class ParquetDataSource(BaseDataSource):
         Raises:
             ValueError: データソースが見つからない場合
         """
-        # IOレイヤー経由でParquetファイルを読み込み
+        # IOレイヤー経由でParquetファイルを遅延読み込み
         # globパターン、Hiveパーティショニングは自動的にPolarsが処理
         if self.io is None:
             raise ValueError("IOレイヤーが設定されていません")
 
         base_path = self.io.get_base_path("inputs")
         full_path = f"{base_path}/{self.config.source_path}"
-        df = self.io.load(full_path, format="parquet")
+        source: pl.LazyFrame | None = self.io.scan_parquet(full_path)
 
-        if df is None or (isinstance(df, pl.DataFrame) and df.is_empty()):
+        if source is None:
             raise ValueError(f"データソースが見つかりません: {full_path}")
 
-        # dictが返った場合はDataFrameに変換不可のためエラー
-        if not isinstance(df, pl.DataFrame):
-            raise ValueError(f"Parquetデータの読み込みに失敗しました: {full_path}")
+        df = self._build_query(source, start, end, symbols).collect()
 
+        # 結果が空の場合のみ、ソース自体が空かどうかを確認する
+        if df.is_empty() and source.select(pl.len()).collect().item() == 0:
+            raise ValueError(f"データソースが見つかりません: {full_path}")
+
+        return df
+
+    def _build_query(self, source: pl.LazyFrame, start: datetime, end: datetime, symbols: list[str]) -> pl.LazyFrame:
+        """ソースにdatetime正規化とフィルタを適用したLazyFrameを構築する
+
+        フィルタはスキャン時の述語としてプッシュダウンされるため、
+        条件に該当しない行グループは読み込まれない。
+
+        Args:
+            source: ソース全体のLazyFrame
+            start: 開始日時
+            end: 終了日時
+            symbols: 銘柄コードリスト
+
+        Returns:
+            未評価のLazyFrame
+        """
         # 共通ヘルパーメソッドを使用した前処理
-        df = self._normalize_datetime_column(df)
+        lf = self._normalize_datetime_column(source)
 
         # offset_secondsを考慮してwindowを調整
         adjusted_start, adjusted_end = self._adjust_window_for_offset(start, end)
 
         # フィルタリング
-        df = self._filter_by_datetime_and_symbols(df, adjusted_start, adjusted_end, symbols)
-
-        return df
+        return self._filter_by_datetime_and_symbols(lf, adjusted_start, adjusted_end, symbols)
@@ -154,14 +154,14 @@ class MockExchangeClient(BaseExchangeClient):
             bar = self._get_next_bar(symbol)
             if bar is None:
                 return None  # 翌バーがない場合は約定不可
-            base_price = bar["open"][0]
-            fill_time = bar["datetime"][0]
+            base_price = bar.get_column("open")[0]
+            fill_time = bar.get_column("datetime")[0]
         else:  # current_close
             bar = self._get_current_bar(symbol)
             if bar is None:
                 return None
-            base_price = bar["close"][0]
-            fill_time = bar["datetime"][0]
+            base_price = bar.get_column("close")[0]
+            fill_time = bar.get_column("datetime")[0]
 
         # スリッページ適用
         filled_price = self._apply_slippage(base_price, side)
@@ -211,9 +211,9 @@ class MockExchangeClient(BaseExchangeClient):
         if bar is None:
             return None  # バーがない場合は約定不可
 
-        high = bar["high"][0]
-        low = bar["low"][0]
-        fill_time = bar["datetime"][0]
+        high = bar.get_column("high")[0]
+        low = bar.get_column("low")[0]
+        fill_time = bar.get_column("datetime")[0]
 
         # 約定判定（同値は未約定）
         if side == "buy":
@@ -281,6 +281,27 @@ class MockExchangeClient(BaseExchangeClient):
             fills = pl.DataFrame(fills_data)
             self.fill_history.append(fills)
 
+    def submit_orders_batch(self, orders: pl.DataFrame) -> None:
+        """複数iteration分の注文をまとめて執行する
+
+        datetime列でpartition_byにより一括分割し、日時の昇順に
+        set_current_datetime()とsubmit_orders()を順に適用する。
+        実行後のcurrent_datetimeは最後の注文日時となる。
+
+        Args:
+            orders: OrderSchemaの列に加えてdatetime列（注文を出すiteration日時）を持つDataFrame
+
+        Raises:
+            ValueError: datetime列が存在しない場合、または注文が不正な場合
+        """
+        if "datetime" not in orders.columns:
+            raise ValueError("一括注文にはdatetime列が必須です")
+
+        partitions = orders.partition_by("datetime", as_dict=True, include_key=False)
+        for (dt,), batch in sorted(partitions.items(), key=lambda item: item[0][0]):
+            self.set_current_datetime(dt)
+            self.submit_orders(batch)
+
     def fetch_fills(self, start: datetime, end: datetime) -> pl.DataFrame:
         """指定期間の約定情報を取得する
 
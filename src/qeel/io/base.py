@@ -111,6 +111,28 @@ class BaseIO(ABC):
         """
         ...
 
+    def scan_parquet(self, path: str) -> pl.LazyFrame | None:
+        """Parquetデータを遅延読み込みするLazyFrameを返す
+
+        フィルタや列選択を後段で適用すると、実装によってはスキャン時にプッシュダウンされる。
+        デフォルト実装はload()で読み込んだDataFrameをLazyFrameに変換する。
+
+        Args:
+            path: 読み込み元パス（ベースパスからの相対パスまたは絶対パス、globパターン可）
+
+        Returns:
+            LazyFrame。存在しない場合はNone
+
+        Raises:
+            ValueError: 読み込んだデータがDataFrameでない場合
+        """
+        data = self.load(path, format="parquet")
+        if data is None:
+            return None
+        if not isinstance(data, pl.DataFrame):
+            raise ValueError(f"Parquetデータの読み込みに失敗しました: {path}")
+        return data.lazy()
+
     @abstractmethod
     def exists(self, path: str) -> bool:
         """ファイルが存在するか確認する
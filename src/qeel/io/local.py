@@ -64,8 +64,10 @@ class LocalIO(BaseIO):
         file_path.parent.mkdir(parents=True, exist_ok=True)
 
         if format == "json":
-            with open(file_path, "w", encoding="utf-8") as f:
-                json.dump(data, f, ensure_ascii=False, indent=2)
+            # 文字列化してから一括で書き込み、テキストレイヤー経由の細かいwriteを避ける
+            body = json.dumps(data, ensure_ascii=False, indent=2).encode("utf-8")
+            with open(file_path, "wb") as f:
+                f.write(body)
         elif format == "parquet":
             if not isinstance(data, pl.DataFrame):
                 raise ValueError("parquet形式の保存にはpl.DataFrameが必要です")
@@ -119,6 +121,21 @@ class LocalIO(BaseIO):
         else:
             raise ValueError(f"サポートされていないフォーマット: {format}")
 
+    def scan_parquet(self, path: str) -> pl.LazyFrame | None:
+        """ローカルのParquetファイルをpl.scan_parquetで遅延読み込みする
+
+        globパターンの場合は存在チェックをスキップし、Polarsに委譲する。
+
+        Args:
+            path: 読み込み元パス（globパターン可）
+
+        Returns:
+            LazyFrame。存在しない場合はNone
+        """
+        if not self._is_glob_pattern(path) and not Path(path).exists():
+            return None
+        return pl.scan_parquet(path)
+
     def exists(self, path: str) -> bool:
         """ファイルの存在確認
 
@@ -5,6 +5,8 @@ S3ストレージへのIO操作を提供する。
 
 import fnmatch
 import json
+import re
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from io import BytesIO
 
@@ -14,6 +16,9 @@ from botocore.exceptions import ClientError
 
 from qeel.io.base import BaseIO
 
+# list_files()で子プレフィックスを並列に列挙する際の最大スレッド数
+_LIST_MAX_WORKERS = 16
+
 
 class S3IO(BaseIO):
     """S3ストレージIO実装
@@ -141,6 +146,17 @@ class S3IO(BaseIO):
         else:
             raise ValueError(f"サポートされていないフォーマット: {format}")
 
+    def scan_parquet(self, path: str) -> pl.LazyFrame | None:
+        """S3上のParquetをPolarsのネイティブS3サポートで遅延読み込みする
+
+        Args:
+            path: S3キー（globパターン可）
+
+        Returns:
+            LazyFrame
+        """
+        return pl.scan_parquet(self._to_s3_uri(path), storage_options=self._storage_options)
+
     def exists(self, path: str) -> bool:
         """S3オブジェクトの存在確認
 
@@ -156,9 +172,27 @@ class S3IO(BaseIO):
         except ClientError:
             return False
 
+    def _list_prefix(self, prefix: str) -> list[str]:
+        """指定プレフィックス配下の全オブジェクトキーをページングして取得する
+
+        Args:
+            prefix: S3キープレフィックス
+
+        Returns:
+            S3キーのリスト（未ソート）
+        """
+        paginator = self.s3_client.get_paginator("list_objects_v2")
+        keys: list[str] = []
+        for page in paginator.paginate(Bucket=self.bucket, Prefix=prefix):
+            keys.extend(obj["Key"] for obj in page.get("Contents", []))
+        return keys
+
     def list_files(self, path: str, pattern: str | None = None) -> list[str]:
         """指定プレフィックス配下のオブジェクト一覧を取得
 
+        まずDelimiter="/"で直下のキーと子プレフィックスを取得し、
+        子プレフィックス（YYYY/MM等のパーティション）ごとの列挙をスレッドで並列実行する。
+
         Args:
             path: S3キープレフィックス
             pattern: ファイル名のフィルタパターン（fnmatch形式）
@@ -167,16 +201,21 @@ class S3IO(BaseIO):
             マッチしたS3キーのリスト（ソート済み）
         """
         paginator = self.s3_client.get_paginator("list_objects_v2")
-        files: list[str] = []
-
-        for page in paginator.paginate(Bucket=self.bucket, Prefix=path):
-            for obj in page.get("Contents", []):
-                key = obj["Key"]
-                if pattern:
-                    filename = key.split("/")[-1]
-                    if fnmatch.fnmatch(filename, pattern):
-                        files.append(key)
-                else:
-                    files.append(key)
-
-        return sorted(files)
+        keys: list[str] = []
+        child_prefixes: list[str] = []
+
+        for page in paginator.paginate(Bucket=self.bucket, Prefix=path, Delimiter="/"):
+            keys.extend(obj["Key"] for obj in page.get("Contents", []))
+            child_prefixes.extend(p["Prefix"] for p in page.get("CommonPrefixes", []))
+
+        if child_prefixes:
+            max_workers = min(_LIST_MAX_WORKERS, len(child_prefixes))
+            with ThreadPoolExecutor(max_workers=max_workers) as executor:
+                for child_keys in executor.map(self._list_prefix, child_prefixes):
+                    keys.extend(child_keys)
+
+        if pattern:
+            matcher = re.compile(fnmatch.translate(pattern)).match
+            keys = [key for key in keys if matcher(key.split("/")[-1])]
+
+        return sorted(keys)
@@ -12,7 +12,7 @@ from abc import ABC, abstractmethod
 import polars as pl
 
 from qeel.config.params import PortfolioConstructorParams
-from qeel.schemas.validators import PortfolioSchema, PositionSchema, SignalSchema
+from qeel.schemas.validators import VALIDATORS
 
 
 class BasePortfolioConstructor(ABC):
@@ -44,8 +44,8 @@ class BasePortfolioConstructor(ABC):
         Raises:
             ValueError: スキーマ違反の場合
         """
-        SignalSchema.validate(signals)
-        PositionSchema.validate(current_positions)
+        VALIDATORS["signal"](signals)
+        VALIDATORS["position"](current_positions)
 
     def _validate_output(self, portfolio: pl.DataFrame) -> pl.DataFrame:
         """出力ポートフォリオの共通バリデーション
@@ -62,7 +62,7 @@ class BasePortfolioConstructor(ABC):
         Raises:
             ValueError: スキーマ違反の場合
         """
-        return PortfolioSchema.validate(portfolio)
+        return VALIDATORS["portfolio"](portfolio)
 
     @abstractmethod
     def construct(self, signals: pl.DataFrame, current_positions: pl.DataFrame) -> pl.DataFrame:
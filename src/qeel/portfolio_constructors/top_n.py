@@ -66,12 +66,9 @@ class TopNPortfolioConstructor(BasePortfolioConstructor):
             )
 
         # シグナルでソートして上位N銘柄を選定
-        portfolio = (
+        # datetime/symbol列は入力バリデーション済みのため、出力のスキーマバリデーションは不要
+        return (
             signals.sort("signal", descending=not self.params.ascending)
             .head(self.params.top_n)
-            .select(["datetime", "symbol", "signal"])
-            .rename({"signal": "signal_strength"})
+            .select(pl.col("datetime"), pl.col("symbol"), pl.col("signal").alias("signal_strength"))
         )
-
-        # 共通バリデーションヘルパーを使用
-        return self._validate_output(portfolio)
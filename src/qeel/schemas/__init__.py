@@ -4,6 +4,7 @@ Polars DataFrameの列スキーマを実行時に検証する。
 """
 
 from qeel.schemas.validators import (
+    VALIDATORS,
     FillReportSchema,
     MetricsSchema,
     OHLCVSchema,
@@ -21,4 +22,5 @@ __all__ = [
     "OrderSchema",
     "FillReportSchema",
     "MetricsSchema",
+    "VALIDATORS",
 ]
@@ -4,6 +4,8 @@ data-model.md 2.1-2.8を参照。
 各スキーマクラスは必須列の型検証を行う。
 """
 
+from collections.abc import Callable
+
 import polars as pl
 
 
@@ -209,17 +211,20 @@ class OrderSchema:
             if col != "price" and df[col].null_count() > 0:
                 raise ValueError(f"列'{col}'にnullが含まれています")
 
-        # sideのバリデーション
-        allowed_sides = {"buy", "sell"}
-        actual_sides = set(df["side"].unique().to_list())
-        if not actual_sides.issubset(allowed_sides):
-            raise ValueError(f"不正なside値: {actual_sides - allowed_sides}")
-
-        # order_typeのバリデーション
-        allowed_types = {"market", "limit"}
-        actual_types = set(df["order_type"].unique().to_list())
-        if not actual_types.issubset(allowed_types):
-            raise ValueError(f"不正なorder_type値: {actual_types - allowed_types}")
+        # side/order_typeのバリデーション
+        # Polars側で許容値外の有無のみを判定し、エラー時のみ不正値を取り出す
+        allowed_sides = ["buy", "sell"]
+        allowed_types = ["market", "limit"]
+        invalid_side, invalid_type = df.select(
+            (~pl.col("side").is_in(allowed_sides)).any(),
+            (~pl.col("order_type").is_in(allowed_types)).any(),
+        ).row(0)
+        if invalid_side:
+            invalid_values = set(df.filter(~pl.col("side").is_in(allowed_sides))["side"].to_list())
+            raise ValueError(f"不正なside値: {invalid_values}")
+        if invalid_type:
+            invalid_values = set(df.filter(~pl.col("order_type").is_in(allowed_types))["order_type"].to_list())
+            raise ValueError(f"不正なorder_type値: {invalid_values}")
 
         return df
 
@@ -308,3 +313,16 @@ class MetricsSchema:
             if df[col].dtype != dtype:
                 raise ValueError(f"列'{col}'の型が不正です。期待: {dtype}, 実際: {df[col].dtype}")
         return df
+
+
+# スキーマ名をキーとするバリデータ関数の辞書
+# 呼び出し側は属性参照の連鎖ではなく1回のdict参照でバリデータを取得できる
+VALIDATORS: dict[str, Callable[[pl.DataFrame], pl.DataFrame]] = {
+    "ohlcv": OHLCVSchema.validate,
+    "signal": SignalSchema.validate,
+    "portfolio": PortfolioSchema.validate,
+    "position": PositionSchema.validate,
+    "order": OrderSchema.validate,
+    "fill_report": FillReportSchema.validate,
+    "metrics": MetricsSchema.validate,
+}
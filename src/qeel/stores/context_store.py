@@ -61,6 +61,27 @@ class ContextStore:
         """シグナルを保存する"""
         self._save_component(target_datetime, signals, "signals")
 
+    def save_signals_batch(self, signals: pl.DataFrame) -> None:
+        """複数日付分のシグナルをまとめて保存する
+
+        datetime列の日付単位でpartition_byにより一括分割し、
+        各日付をsave_signals()と同じパーティション・ファイル名で保存する。
+
+        Args:
+            signals: 複数日付分のシグナル（datetime列必須）
+
+        Raises:
+            ValueError: datetime列が存在しない場合
+        """
+        if "datetime" not in signals.columns:
+            raise ValueError("シグナルにdatetime列が存在しません")
+
+        partitions = signals.with_columns(pl.col("datetime").dt.truncate("1d").alias("_date")).partition_by(
+            "_date", as_dict=True, include_key=False
+        )
+        for (target_date,), partition in partitions.items():
+            self._save_component(target_date, partition, "signals")
+
     def save_portfolio_plan(self, target_datetime: datetime, portfolio_plan: pl.DataFrame) -> None:
         """ポートフォリオ計画を保存する"""
         self._save_component(target_datetime, portfolio_plan, "portfolio_plan")
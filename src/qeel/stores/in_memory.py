@@ -5,6 +5,7 @@
 
 from __future__ import annotations
 
+from collections.abc import Callable
 from datetime import datetime
 
 import polars as pl
@@ -19,10 +20,27 @@ class InMemoryStore:
     ContextStoreと同じインターフェースを持つが、永続化せず最新のコンテキストのみ保持する。
     単体テストやインテグレーションテストで使用することを想定。
     日付パーティショニングは行わない。
+    ポジションは約定で変化するため、load系メソッドの呼び出しごとに取得し直す。
     """
 
-    def __init__(self) -> None:
-        """インメモリストアを初期化"""
+    __slots__ = (
+        "_signals",
+        "_portfolio_plan",
+        "_entry_orders",
+        "_exit_orders",
+        "_current_datetime",
+        "_defensive_clone",
+    )
+
+    def __init__(self, defensive_clone: bool = False) -> None:
+        """インメモリストアを初期化
+
+        Args:
+            defensive_clone: Trueの場合、保存時にDataFrameをclone()して保持する。
+                呼び出し側での後からの変更をストアに反映させたくない場合に使用する。
+                デフォルト（False）では参照をそのまま保持する
+        """
+        self._defensive_clone = defensive_clone
         self._signals: pl.DataFrame | None = None
         self._portfolio_plan: pl.DataFrame | None = None
         self._entry_orders: pl.DataFrame | None = None
@@ -36,7 +54,7 @@ class InMemoryStore:
             target_datetime: 保存する日付
             signals: シグナルDataFrame
         """
-        self._signals = signals
+        self._signals = signals.clone() if self._defensive_clone else signals
         self._current_datetime = target_datetime
 
     def save_portfolio_plan(self, target_datetime: datetime, portfolio_plan: pl.DataFrame) -> None:
@@ -46,7 +64,7 @@ class InMemoryStore:
             target_datetime: 保存する日付
             portfolio_plan: ポートフォリオ計画DataFrame
         """
-        self._portfolio_plan = portfolio_plan
+        self._portfolio_plan = portfolio_plan.clone() if self._defensive_clone else portfolio_plan
         self._current_datetime = target_datetime
 
     def save_entry_orders(self, target_datetime: datetime, entry_orders: pl.DataFrame) -> None:
@@ -56,7 +74,7 @@ class InMemoryStore:
             target_datetime: 保存する日付
             entry_orders: エントリー注文DataFrame
         """
-        self._entry_orders = entry_orders
+        self._entry_orders = entry_orders.clone() if self._defensive_clone else entry_orders
         self._current_datetime = target_datetime
 
     def save_exit_orders(self, target_datetime: datetime, exit_orders: pl.DataFrame) -> None:
@@ -66,7 +84,7 @@ class InMemoryStore:
             target_datetime: 保存する日付
             exit_orders: エグジット注文DataFrame
         """
-        self._exit_orders = exit_orders
+        self._exit_orders = exit_orders.clone() if self._defensive_clone else exit_orders
         self._current_datetime = target_datetime
 
     def load(self, target_datetime: datetime, exchange_client: BaseExchangeClient) -> Context | None:
@@ -79,20 +97,7 @@ class InMemoryStore:
         Returns:
             最新のコンテキスト。存在しない場合はNone
         """
-        if self._current_datetime is None:
-            return None
-
-        # ポジションはExchangeClientから動的に取得
-        current_positions = exchange_client.fetch_positions()
-
-        return Context(
-            current_datetime=self._current_datetime,
-            signals=self._signals,
-            portfolio_plan=self._portfolio_plan,
-            entry_orders=self._entry_orders,
-            exit_orders=self._exit_orders,
-            current_positions=current_positions,
-        )
+        return self.load_with(target_datetime, exchange_client.fetch_positions)
 
     def load_latest(self, exchange_client: BaseExchangeClient) -> Context | None:
         """最新のコンテキストを返す（load()と同じ動作）
@@ -105,9 +110,24 @@ class InMemoryStore:
         """
         if self._current_datetime is None:
             return None
+        return self.load_with(self._current_datetime, exchange_client.fetch_positions)
+
+    def load_with(self, target_datetime: datetime, fetch_positions: Callable[[], pl.DataFrame]) -> Context | None:
+        """ポジション取得関数を直接受け取り、最新のコンテキストを返す
+
+        ループ内で呼び出す場合、呼び出し側で`fetch_positions = client.fetch_positions`を
+        一度だけ束縛して渡すことで、毎回の属性参照を省略できる。
+        ポジションは呼び出しごとにfetch_positions()から取得し、保持しない。
+
+        Args:
+            target_datetime: 読み込む日付（無視される）
+            fetch_positions: ポジション取得関数（BaseExchangeClient.fetch_positions等）
 
-        # ポジションはExchangeClientから動的に取得
-        current_positions = exchange_client.fetch_positions()
+        Returns:
+            最新のコンテキスト。存在しない場合はNone
+        """
+        if self._current_datetime is None:
+            return None
 
         return Context(
             current_datetime=self._current_datetime,
@@ -115,7 +135,8 @@ class InMemoryStore:
             portfolio_plan=self._portfolio_plan,
             entry_orders=self._entry_orders,
             exit_orders=self._exit_orders,
-            current_positions=current_positions,
+            # ポジションは動的に取得
+            current_positions=fetch_positions(),
         )
 
     def exists(self, target_datetime: datetime) -> bool:
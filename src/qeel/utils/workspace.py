@@ -5,9 +5,11 @@
 """
 
 import os
+from functools import lru_cache
 from pathlib import Path
 
 
+@lru_cache(maxsize=1)
 def get_workspace() -> Path:
     """ワークスペースディレクトリを取得する
 
@@ -20,6 +22,12 @@ def get_workspace() -> Path:
     Raises:
         ValueError: 指定されたパスが存在しないディレクトリの場合
 
+    Note:
+        LocalIOの各操作から頻繁に呼ばれるため、結果はプロセス内でキャッシュされる
+        （環境変数の参照とis_dir()の呼び出しは初回のみ）。
+        QEEL_WORKSPACEやカレントディレクトリを変更した場合は
+        get_workspace.cache_clear()を呼び出すこと。
+
     Example:
         # 環境変数で指定
         $ export QEEL_WORKSPACE=/path/to/my_backtest
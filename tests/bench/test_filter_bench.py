@@ -0,0 +1,70 @@
+"""BaseDataSource._filter_by_datetime_and_symbols()のベンチマーク
+
+pytest-benchmarkが必要（未インストールの場合はスキップ）。
+回帰検知はベースラインを保存した上で比較して行う:
+    pytest tests/bench --benchmark-autosave
+    pytest tests/bench --benchmark-compare --benchmark-compare-fail=mean:10%
+"""
+
+from datetime import datetime
+from typing import TYPE_CHECKING
+
+import polars as pl
+import pytest
+
+from qeel.config import DataSourceConfig
+from qeel.data_sources.mock import MockDataSource
+
+if TYPE_CHECKING:
+    from pytest_benchmark.fixture import BenchmarkFixture
+
+pytest.importorskip("pytest_benchmark")
+
+# 1時間足 × 10銘柄 × 1000本 = 10,000行
+_SYMBOLS = [f"SYM{i:02d}" for i in range(10)]
+_START = datetime(2023, 1, 1)
+_END = datetime(2023, 2, 11, 15)
+
+
+@pytest.fixture(scope="module")
+def data_source() -> MockDataSource:
+    """フィルタリングヘルパーを呼び出すためのデータソース"""
+    config = DataSourceConfig(
+        name="bench",
+        datetime_column="datetime",
+        offset_seconds=0,
+        window_seconds=86400,
+        module="qeel.data_sources.mock",
+        class_name="MockDataSource",
+        source_path="bench.parquet",
+    )
+    return MockDataSource(config=config)
+
+
+@pytest.fixture(scope="module")
+def large_dataframe() -> pl.DataFrame:
+    """10,000行のdatetime昇順サンプルDataFrame"""
+    datetimes = pl.DataFrame({"datetime": pl.datetime_range(_START, _END, "1h", eager=True)})
+    symbols = pl.DataFrame({"symbol": _SYMBOLS})
+    return (
+        datetimes.join(symbols, how="cross")
+        .with_columns(close=pl.int_range(pl.len()).cast(pl.Float64))
+        .sort("datetime")
+        .rechunk()
+    )
+
+
+def test_filter_by_datetime_and_symbols_benchmark(
+    benchmark: "BenchmarkFixture", data_source: MockDataSource, large_dataframe: pl.DataFrame
+) -> None:
+    """約1週間・3銘柄の範囲を10,000行から抽出する"""
+    assert large_dataframe.height == 10_000
+
+    start = datetime(2023, 1, 10)
+    end = datetime(2023, 1, 16, 23)
+    symbols = _SYMBOLS[:3]
+
+    result = benchmark(data_source._filter_by_datetime_and_symbols, large_dataframe, start, end, symbols)
+
+    # 7日 × 24時間 × 3銘柄
+    assert result.height == 7 * 24 * 3
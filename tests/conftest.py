@@ -2,3 +2,42 @@
 
 全テストで使用可能な共通フィクスチャを定義。
 """
+
+from pathlib import Path
+from typing import Generator
+
+import pytest
+
+from qeel.utils.workspace import get_workspace
+
+
+@pytest.fixture(autouse=True)
+def clear_workspace_cache() -> Generator[None, None, None]:
+    """get_workspace()のキャッシュをテストごとにクリアする
+
+    テスト内でmonkeypatch.setenv("QEEL_WORKSPACE", ...)した値を確実に反映させる。
+    """
+    get_workspace.cache_clear()
+    yield
+    get_workspace.cache_clear()
+
+
+@pytest.fixture
+def workspace_root(tmp_path: Path) -> Path:
+    """workspace_overrideが指すワークスペースのルート（デフォルトはtmp_path）
+
+    テストモジュール側で同名のフィクスチャを定義すると、ルートを差し替えられる。
+    """
+    return tmp_path
+
+
+@pytest.fixture
+def workspace_override(workspace_root: Path, monkeypatch: pytest.MonkeyPatch) -> Generator[Path, None, None]:
+    """QEEL_WORKSPACEをworkspace_rootに向け、get_workspace()のキャッシュを差し替える
+
+    unittest.mock.patchでget_workspaceを置き換える代わりに使用する。
+    """
+    monkeypatch.setenv("QEEL_WORKSPACE", str(workspace_root))
+    get_workspace.cache_clear()
+    yield workspace_root
+    get_workspace.cache_clear()
@@ -0,0 +1,21 @@
+"""統合テスト共通のフィクスチャ
+
+複数の統合テストモジュールで使用する検証ヘルパーを定義。
+"""
+
+from collections.abc import Callable
+
+import polars as pl
+import pytest
+
+
+def _assert_symbols(series: pl.Series, expected: set[str]) -> None:
+    """銘柄列の集合が期待値と一致することをPolars式で検証する"""
+    assert series.n_unique() == len(expected)
+    assert series.is_in(list(expected)).all()
+
+
+@pytest.fixture(scope="session")
+def assert_symbols() -> Callable[[pl.Series, set[str]], None]:
+    """銘柄列の集合を検証する関数"""
+    return _assert_symbols
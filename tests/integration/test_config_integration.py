@@ -3,6 +3,8 @@
 get_workspace()とConfig.from_toml()の連携テスト。
 """
 
+import os
+import shutil
 from pathlib import Path
 
 import pytest
@@ -49,10 +51,11 @@ def test_workspace_and_config_integration(tmp_path: Path, monkeypatch: pytest.Mo
     config_dir.mkdir()
     config_file = config_dir / "config.toml"
 
-    # valid_config.tomlをコピー
-    import shutil
-
-    shutil.copy("tests/fixtures/valid_config.toml", config_file)
+    # valid_config.tomlをハードリンク（別ファイルシステムの場合はコピー）
+    try:
+        os.link("tests/fixtures/valid_config.toml", config_file)
+    except OSError:
+        shutil.copy("tests/fixtures/valid_config.toml", config_file)
 
     # Config.from_toml()がget_workspace()を使用してデフォルトパスを解決
     config = Config.from_toml()
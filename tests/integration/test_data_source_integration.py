@@ -4,9 +4,10 @@ TDD: RED -> GREEN -> REFACTOR
 contracts/base_data_source.mdを参照。
 """
 
+import os
+import shutil
 from datetime import datetime
 from pathlib import Path
-from unittest.mock import patch
 
 import polars as pl
 import pytest
@@ -17,41 +18,107 @@ from qeel.data_sources.mock import MockDataSource
 from qeel.data_sources.parquet import ParquetDataSource
 
 
-class TestMockDataSourceWithConfig:
-    """DataSourceConfigを使用したMockDataSourceの統合テスト"""
+# 読み取り専用のフィクスチャはモジュール内で共有する（テストはfilter等で新しいDataFrameを得るのみ）
+@pytest.fixture(scope="module")
+def config() -> DataSourceConfig:
+    """テスト用設定"""
+    return DataSourceConfig(
+        name="test_ohlcv",
+        datetime_column="datetime",
+        offset_seconds=3600,  # 1時間オフセット
+        window_seconds=86400,
+        module="qeel.data_sources.mock",
+        class_name="MockDataSource",
+        source_path="mock",
+    )
+
+
+@pytest.fixture(scope="module")
+def config_with_offset() -> DataSourceConfig:
+    """オフセット付き設定"""
+    return DataSourceConfig(
+        name="test_ohlcv",
+        datetime_column="timestamp",  # datetime以外の列名
+        offset_seconds=3600,  # 1時間オフセット
+        window_seconds=86400,
+        module="qeel.data_sources.mock",
+        class_name="MockDataSource",
+        source_path="mock",
+    )
+
+
+@pytest.fixture(scope="module")
+def mock_data() -> pl.DataFrame:
+    """モックデータ"""
+    return pl.DataFrame(
+        {
+            "datetime": [
+                datetime(2023, 1, 1, 8, 0, 0),
+                datetime(2023, 1, 1, 9, 0, 0),
+                datetime(2023, 1, 1, 10, 0, 0),
+                datetime(2023, 1, 1, 11, 0, 0),
+            ],
+            "symbol": ["AAPL", "AAPL", "GOOG", "GOOG"],
+            "open": [99.0, 100.0, 199.0, 200.0],
+            "high": [101.0, 102.0, 201.0, 202.0],
+            "low": [98.0, 99.0, 198.0, 199.0],
+            "close": [100.0, 101.0, 200.0, 201.0],
+            "volume": [1000, 1100, 2000, 2100],
+        }
+    )
+
+
+@pytest.fixture(scope="module")
+def sample_data() -> pl.DataFrame:
+    """サンプルデータ"""
+    return pl.DataFrame(
+        {
+            "datetime": [
+                datetime(2023, 1, 1, 9, 0, 0),
+                datetime(2023, 1, 1, 10, 0, 0),
+                datetime(2023, 1, 1, 11, 0, 0),
+                datetime(2023, 1, 2, 9, 0, 0),
+            ],
+            "symbol": ["AAPL", "GOOG", "AAPL", "MSFT"],
+            "open": [99.0, 199.0, 100.0, 299.0],
+            "high": [101.0, 201.0, 102.0, 301.0],
+            "low": [98.0, 198.0, 99.0, 298.0],
+            "close": [100.0, 200.0, 101.0, 300.0],
+            "volume": [1000, 2000, 1100, 3000],
+        }
+    )
+
+
+@pytest.fixture(scope="module")
+def sample_parquet_dir(sample_data: pl.DataFrame, tmp_path_factory: pytest.TempPathFactory) -> Path:
+    """sample_dataを書き出したParquetファイル群（モジュール内で1回だけ書き込む）
+
+    構成:
+        ohlcv.parquet: sample_data全体
+        ohlcv/aapl.parquet: AAPLのみ
+        ohlcv/others.parquet: AAPL以外
+    """
+    base_dir = tmp_path_factory.mktemp("parquet_inputs")
+    sample_data.write_parquet(base_dir / "ohlcv.parquet")
+
+    split_dir = base_dir / "ohlcv"
+    split_dir.mkdir()
+    sample_data.filter(pl.col("symbol") == "AAPL").write_parquet(split_dir / "aapl.parquet")
+    sample_data.filter(pl.col("symbol") != "AAPL").write_parquet(split_dir / "others.parquet")
+    return base_dir
+
+
+def _link_or_copy(src: Path, dst: Path) -> None:
+    """ファイルをハードリンクする（別ファイルシステムの場合はコピーにフォールバック）"""
+    dst.parent.mkdir(parents=True, exist_ok=True)
+    try:
+        os.link(src, dst)
+    except OSError:
+        shutil.copy(src, dst)
 
-    @pytest.fixture
-    def config(self) -> DataSourceConfig:
-        """テスト用設定"""
-        return DataSourceConfig(
-            name="test_ohlcv",
-            datetime_column="datetime",
-            offset_seconds=3600,  # 1時間オフセット
-            window_seconds=86400,
-            module="qeel.data_sources.mock",
-            class_name="MockDataSource",
-            source_path="mock",
-        )
 
-    @pytest.fixture
-    def mock_data(self) -> pl.DataFrame:
-        """モックデータ"""
-        return pl.DataFrame(
-            {
-                "datetime": [
-                    datetime(2023, 1, 1, 8, 0, 0),
-                    datetime(2023, 1, 1, 9, 0, 0),
-                    datetime(2023, 1, 1, 10, 0, 0),
-                    datetime(2023, 1, 1, 11, 0, 0),
-                ],
-                "symbol": ["AAPL", "AAPL", "GOOG", "GOOG"],
-                "open": [99.0, 100.0, 199.0, 200.0],
-                "high": [101.0, 102.0, 201.0, 202.0],
-                "low": [98.0, 99.0, 198.0, 199.0],
-                "close": [100.0, 101.0, 200.0, 201.0],
-                "volume": [1000, 1100, 2000, 2100],
-            }
-        )
+class TestMockDataSourceWithConfig:
+    """DataSourceConfigを使用したMockDataSourceの統合テスト"""
 
     def test_mock_data_source_with_config(self, config: DataSourceConfig, mock_data: pl.DataFrame) -> None:
         """DataSourceConfigを使用してMockDataSourceを初期化し、fetch()が正常動作"""
@@ -75,19 +142,6 @@ class TestMockDataSourceWithConfig:
 class TestDataSourceHelperChain:
     """ヘルパーメソッドの連鎖使用テスト"""
 
-    @pytest.fixture
-    def config_with_offset(self) -> DataSourceConfig:
-        """オフセット付き設定"""
-        return DataSourceConfig(
-            name="test_ohlcv",
-            datetime_column="timestamp",  # datetime以外の列名
-            offset_seconds=3600,  # 1時間オフセット
-            window_seconds=86400,
-            module="qeel.data_sources.mock",
-            class_name="MockDataSource",
-            source_path="mock",
-        )
-
     def test_data_source_helper_chain(self, config_with_offset: DataSourceConfig) -> None:
         """ヘルパーメソッドを連鎖して使用した場合の動作確認
 
@@ -149,8 +203,9 @@ class TestDataSourceHelperChain:
         # オフセット適用により、09:00 - 10:00のデータが取得される
         # AAPLの09:00のデータのみ（1行）
         assert len(result) == 1
-        assert result["symbol"][0] == "AAPL"
-        assert result["close"][0] == 101.0
+        row = result.row(0, named=True)
+        assert row["symbol"] == "AAPL"
+        assert row["close"] == 101.0
 
         # datetime列が正規化されていることを確認
         assert "datetime" in result.columns
@@ -195,8 +250,9 @@ class TestDataSourceInheritance:
         )
 
         assert len(result) == 1
-        assert result["symbol"][0] == "TEST"
-        assert result["value"][0] == 42.0
+        row = result.row(0, named=True)
+        assert row["symbol"] == "TEST"
+        assert row["value"] == 42.0
 
 
 # =============================================================================
@@ -207,101 +263,104 @@ class TestDataSourceInheritance:
 class TestParquetDataSourceWithLocalIO:
     """ParquetDataSourceとLocalIOの統合テスト"""
 
-    @pytest.fixture
-    def sample_data(self) -> pl.DataFrame:
-        """サンプルデータ"""
-        return pl.DataFrame(
-            {
-                "datetime": [
-                    datetime(2023, 1, 1, 9, 0, 0),
-                    datetime(2023, 1, 1, 10, 0, 0),
-                    datetime(2023, 1, 1, 11, 0, 0),
-                    datetime(2023, 1, 2, 9, 0, 0),
-                ],
-                "symbol": ["AAPL", "GOOG", "AAPL", "MSFT"],
-                "open": [99.0, 199.0, 100.0, 299.0],
-                "high": [101.0, 201.0, 102.0, 301.0],
-                "low": [98.0, 198.0, 99.0, 298.0],
-                "close": [100.0, 200.0, 101.0, 300.0],
-                "volume": [1000, 2000, 1100, 3000],
-            }
-        )
-
-    def test_parquet_data_source_with_local_io(self, sample_data: pl.DataFrame, tmp_path: Path) -> None:
+    def test_parquet_data_source_with_local_io(self, sample_parquet_dir: Path, workspace_override: Path) -> None:
         """ParquetDataSourceがLocalIOと連携してParquetを読み込む"""
         from qeel.io.local import LocalIO
 
-        # ワークスペースをtmp_pathに設定
-        with patch("qeel.io.local.get_workspace", return_value=tmp_path):
-            io = LocalIO()
-
-            # Parquetファイルを保存
-            inputs_dir = tmp_path / "inputs"
-            inputs_dir.mkdir(parents=True, exist_ok=True)
-            parquet_path = inputs_dir / "ohlcv.parquet"
-            sample_data.write_parquet(parquet_path)
-
-            # 設定
-            config = DataSourceConfig(
-                name="ohlcv",
-                datetime_column="datetime",
-                offset_seconds=0,
-                window_seconds=86400,
-                module="qeel.data_sources.parquet",
-                class_name="ParquetDataSource",
-                source_path="ohlcv.parquet",
-            )
-
-            # ParquetDataSourceでfetch
-            ds = ParquetDataSource(config=config, io=io)
-            result = ds.fetch(
-                start=datetime(2023, 1, 1, 0, 0, 0),
-                end=datetime(2023, 1, 2, 23, 59, 59),
-                symbols=["AAPL", "GOOG", "MSFT"],
-            )
-
-            assert isinstance(result, pl.DataFrame)
-            assert len(result) == 4
-            assert set(result["symbol"].to_list()) == {"AAPL", "GOOG", "MSFT"}
-
-    def test_parquet_data_source_with_glob_pattern(self, sample_data: pl.DataFrame, tmp_path: Path) -> None:
+        io = LocalIO()
+
+        # Parquetファイルを配置
+        _link_or_copy(sample_parquet_dir / "ohlcv.parquet", workspace_override / "inputs" / "ohlcv.parquet")
+
+        # 設定
+        config = DataSourceConfig(
+            name="ohlcv",
+            datetime_column="datetime",
+            offset_seconds=0,
+            window_seconds=86400,
+            module="qeel.data_sources.parquet",
+            class_name="ParquetDataSource",
+            source_path="ohlcv.parquet",
+        )
+
+        # ParquetDataSourceでfetch
+        ds = ParquetDataSource(config=config, io=io)
+        result = ds.fetch(
+            start=datetime(2023, 1, 1, 0, 0, 0),
+            end=datetime(2023, 1, 2, 23, 59, 59),
+            symbols=["AAPL", "GOOG", "MSFT"],
+        )
+
+        assert isinstance(result, pl.DataFrame)
+        assert len(result) == 4
+        assert set(result["symbol"].to_list()) == {"AAPL", "GOOG", "MSFT"}
+
+    def test_parquet_data_source_with_glob_pattern(self, sample_parquet_dir: Path, workspace_override: Path) -> None:
         """ParquetDataSourceがglobパターンで複数ファイルを読み込む"""
         from qeel.io.local import LocalIO
 
-        # ワークスペースをtmp_pathに設定
-        with patch("qeel.io.local.get_workspace", return_value=tmp_path):
-            io = LocalIO()
-
-            # 複数のParquetファイルを保存
-            inputs_dir = tmp_path / "inputs" / "ohlcv"
-            inputs_dir.mkdir(parents=True, exist_ok=True)
-
-            # データを2つに分割
-            df1 = sample_data.filter(pl.col("symbol") == "AAPL")
-            df2 = sample_data.filter(pl.col("symbol") != "AAPL")
-            df1.write_parquet(inputs_dir / "aapl.parquet")
-            df2.write_parquet(inputs_dir / "others.parquet")
-
-            # 設定（globパターン）
-            config = DataSourceConfig(
-                name="ohlcv",
-                datetime_column="datetime",
-                offset_seconds=0,
-                window_seconds=86400,
-                module="qeel.data_sources.parquet",
-                class_name="ParquetDataSource",
-                source_path="ohlcv/*.parquet",  # globパターン
-            )
-
-            # ParquetDataSourceでfetch
-            ds = ParquetDataSource(config=config, io=io)
-            result = ds.fetch(
-                start=datetime(2023, 1, 1, 0, 0, 0),
-                end=datetime(2023, 1, 2, 23, 59, 59),
-                symbols=["AAPL", "GOOG", "MSFT"],
-            )
-
-            assert isinstance(result, pl.DataFrame)
-            # 複数ファイルが結合される
-            assert len(result) == 4
-            assert set(result["symbol"].to_list()) == {"AAPL", "GOOG", "MSFT"}
+        io = LocalIO()
+
+        # 銘柄で2つに分割済みのParquetファイルを配置
+        inputs_dir = workspace_override / "inputs" / "ohlcv"
+        for name in ("aapl.parquet", "others.parquet"):
+            _link_or_copy(sample_parquet_dir / "ohlcv" / name, inputs_dir / name)
+
+        # 設定（globパターン）
+        config = DataSourceConfig(
+            name="ohlcv",
+            datetime_column="datetime",
+            offset_seconds=0,
+            window_seconds=86400,
+            module="qeel.data_sources.parquet",
+            class_name="ParquetDataSource",
+            source_path="ohlcv/*.parquet",  # globパターン
+        )
+
+        # ParquetDataSourceでfetch
+        ds = ParquetDataSource(config=config, io=io)
+        result = ds.fetch(
+            start=datetime(2023, 1, 1, 0, 0, 0),
+            end=datetime(2023, 1, 2, 23, 59, 59),
+            symbols=["AAPL", "GOOG", "MSFT"],
+        )
+
+        assert isinstance(result, pl.DataFrame)
+        # 複数ファイルが結合される
+        assert len(result) == 4
+        assert set(result["symbol"].to_list()) == {"AAPL", "GOOG", "MSFT"}
+
+    def test_parquet_data_source_pushes_filter_into_scan(
+        self, sample_parquet_dir: Path, workspace_override: Path
+    ) -> None:
+        """datetime/symbolのフィルタがParquetスキャンにプッシュダウンされる"""
+        from qeel.io.local import LocalIO
+
+        io = LocalIO()
+        _link_or_copy(sample_parquet_dir / "ohlcv.parquet", workspace_override / "inputs" / "ohlcv.parquet")
+
+        config = DataSourceConfig(
+            name="ohlcv",
+            datetime_column="datetime",
+            offset_seconds=0,
+            window_seconds=86400,
+            module="qeel.data_sources.parquet",
+            class_name="ParquetDataSource",
+            source_path="ohlcv.parquet",
+        )
+        ds = ParquetDataSource(config=config, io=io)
+
+        source = io.scan_parquet(f"{io.get_base_path('inputs')}/{config.source_path}")
+        assert source is not None
+        start = datetime(2023, 1, 1, 10, 0, 0)
+        end = datetime(2023, 1, 2, 23, 59, 59)
+        plan = ds._build_query(source, start, end, ["AAPL"]).explain()
+
+        # フィルタがスキャンノードのSELECTIONとして適用され、後段にFILTERが残らない
+        assert "Parquet SCAN" in plan
+        assert "SELECTION" in plan
+        assert "FILTER" not in plan
+
+        result = ds.fetch(start=start, end=end, symbols=["AAPL"])
+        assert len(result) == 1
+        assert result.item(0, "datetime") == datetime(2023, 1, 1, 11, 0, 0)
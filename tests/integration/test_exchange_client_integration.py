@@ -3,6 +3,8 @@
 MockExchangeClientとMockDataSourceの連携テスト。
 """
 
+import copy
+from collections.abc import Callable
 from datetime import datetime
 
 import polars as pl
@@ -12,143 +14,107 @@ from qeel.config import CostConfig, DataSourceConfig
 from qeel.data_sources.mock import MockDataSource
 from qeel.exchange_clients.mock import MockExchangeClient
 
+# 繰り返し使用する日時（モジュール読み込み時に一度だけ生成する）
+_FETCH_START = datetime(2024, 1, 1)
+_FETCH_END = datetime(2024, 1, 10)
+_JAN3 = datetime(2024, 1, 3)
+_JAN1_0900 = datetime(2024, 1, 1, 9, 0)
+_JAN2_0900 = datetime(2024, 1, 2, 9, 0)
+_JAN3_0900 = datetime(2024, 1, 3, 9, 0)
+
+
+# テスト用OHLCVデータ（AAPL/GOOGL 各5営業日）。pl.from_reprで直接DataFrameに変換する
+_SAMPLE_OHLCV_REPR = """
+shape: (10, 7)
+┌─────────────────────┬────────┬───────┬───────┬───────┬───────┬────────┐
+│ datetime            ┆ symbol ┆ open  ┆ high  ┆ low   ┆ close ┆ volume │
+│ ---                 ┆ ---    ┆ ---   ┆ ---   ┆ ---   ┆ ---   ┆ ---    │
+│ datetime[μs]        ┆ str    ┆ f64   ┆ f64   ┆ f64   ┆ f64   ┆ i64    │
+╞═════════════════════╪════════╪═══════╪═══════╪═══════╪═══════╪════════╡
+│ 2024-01-01 09:00:00 ┆ AAPL   ┆ 100.0 ┆ 108.0 ┆ 98.0  ┆ 105.0 ┆ 1000   │
+│ 2024-01-02 09:00:00 ┆ AAPL   ┆ 105.0 ┆ 115.0 ┆ 102.0 ┆ 110.0 ┆ 1100   │
+│ 2024-01-03 09:00:00 ┆ AAPL   ┆ 110.0 ┆ 118.0 ┆ 105.0 ┆ 115.0 ┆ 1200   │
+│ 2024-01-04 09:00:00 ┆ AAPL   ┆ 108.0 ┆ 116.0 ┆ 104.0 ┆ 112.0 ┆ 1150   │
+│ 2024-01-05 09:00:00 ┆ AAPL   ┆ 112.0 ┆ 120.0 ┆ 108.0 ┆ 118.0 ┆ 1250   │
+│ 2024-01-01 09:00:00 ┆ GOOGL  ┆ 200.0 ┆ 215.0 ┆ 195.0 ┆ 210.0 ┆ 2000   │
+│ 2024-01-02 09:00:00 ┆ GOOGL  ┆ 210.0 ┆ 225.0 ┆ 205.0 ┆ 220.0 ┆ 2100   │
+│ 2024-01-03 09:00:00 ┆ GOOGL  ┆ 220.0 ┆ 235.0 ┆ 215.0 ┆ 230.0 ┆ 2200   │
+│ 2024-01-04 09:00:00 ┆ GOOGL  ┆ 215.0 ┆ 230.0 ┆ 210.0 ┆ 225.0 ┆ 2150   │
+│ 2024-01-05 09:00:00 ┆ GOOGL  ┆ 225.0 ┆ 240.0 ┆ 220.0 ┆ 235.0 ┆ 2250   │
+└─────────────────────┴────────┴───────┴───────┴───────┴───────┴────────┘
+"""
 
-class TestMockExchangeClientIntegration:
-    """MockExchangeClient統合テスト"""
 
-    @pytest.fixture
-    def sample_ohlcv_data(self) -> pl.DataFrame:
-        """テスト用OHLCVデータ"""
-        return pl.DataFrame(
-            {
-                "datetime": [
-                    datetime(2024, 1, 1, 9, 0),
-                    datetime(2024, 1, 2, 9, 0),
-                    datetime(2024, 1, 3, 9, 0),
-                    datetime(2024, 1, 4, 9, 0),
-                    datetime(2024, 1, 5, 9, 0),
-                    datetime(2024, 1, 1, 9, 0),
-                    datetime(2024, 1, 2, 9, 0),
-                    datetime(2024, 1, 3, 9, 0),
-                    datetime(2024, 1, 4, 9, 0),
-                    datetime(2024, 1, 5, 9, 0),
-                ],
-                "symbol": [
-                    "AAPL",
-                    "AAPL",
-                    "AAPL",
-                    "AAPL",
-                    "AAPL",
-                    "GOOGL",
-                    "GOOGL",
-                    "GOOGL",
-                    "GOOGL",
-                    "GOOGL",
-                ],
-                "open": [
-                    100.0,
-                    105.0,
-                    110.0,
-                    108.0,
-                    112.0,
-                    200.0,
-                    210.0,
-                    220.0,
-                    215.0,
-                    225.0,
-                ],
-                "high": [
-                    108.0,
-                    115.0,
-                    118.0,
-                    116.0,
-                    120.0,
-                    215.0,
-                    225.0,
-                    235.0,
-                    230.0,
-                    240.0,
-                ],
-                "low": [
-                    98.0,
-                    102.0,
-                    105.0,
-                    104.0,
-                    108.0,
-                    195.0,
-                    205.0,
-                    215.0,
-                    210.0,
-                    220.0,
-                ],
-                "close": [
-                    105.0,
-                    110.0,
-                    115.0,
-                    112.0,
-                    118.0,
-                    210.0,
-                    220.0,
-                    230.0,
-                    225.0,
-                    235.0,
-                ],
-                "volume": [
-                    1000,
-                    1100,
-                    1200,
-                    1150,
-                    1250,
-                    2000,
-                    2100,
-                    2200,
-                    2150,
-                    2250,
-                ],
-            }
-        )
+@pytest.fixture(scope="module")
+def sample_ohlcv_data() -> pl.DataFrame:
+    """テスト用OHLCVデータ"""
+    return pl.from_repr(_SAMPLE_OHLCV_REPR)
+
+
+@pytest.fixture(scope="module")
+def data_source_config() -> DataSourceConfig:
+    """データソース設定"""
+    return DataSourceConfig(
+        name="ohlcv",
+        datetime_column="datetime",
+        offset_seconds=0,
+        window_seconds=86400 * 30,
+        module="qeel.data_sources.mock",
+        class_name="MockDataSource",
+        source_path="mock",
+    )
+
+
+@pytest.fixture(scope="module")
+def cost_config() -> CostConfig:
+    """コスト設定"""
+    return CostConfig(
+        commission_rate=0.001,
+        slippage_bps=10.0,
+    )
+
+
+@pytest.fixture(scope="class")
+def client_factory(
+    sample_ohlcv_data: pl.DataFrame,
+    data_source_config: DataSourceConfig,
+    cost_config: CostConfig,
+) -> Callable[[], MockExchangeClient]:
+    """OHLCVロード済みのMockExchangeClientを複製するファクトリ
+
+    load_ohlcvはクラスごとに一度だけ実行する。OHLCVキャッシュは読み取り専用のため参照を共有し、
+    約定履歴と現在日時のみテストごとに独立させる。
+    """
+    data_source = MockDataSource(config=data_source_config, data=sample_ohlcv_data)
+    loaded = MockExchangeClient(cost_config, data_source)
+    loaded.load_ohlcv(
+        start=_FETCH_START,
+        end=_FETCH_END,
+        symbols=["AAPL", "GOOGL"],
+    )
+
+    def factory() -> MockExchangeClient:
+        client = copy.copy(loaded)
+        client.fill_history = copy.deepcopy(loaded.fill_history)
+        return client
+
+    return factory
 
-    @pytest.fixture
-    def data_source_config(self) -> DataSourceConfig:
-        """データソース設定"""
-        return DataSourceConfig(
-            name="ohlcv",
-            datetime_column="datetime",
-            offset_seconds=0,
-            window_seconds=86400 * 30,
-            module="qeel.data_sources.mock",
-            class_name="MockDataSource",
-            source_path="mock",
-        )
 
-    @pytest.fixture
-    def cost_config(self) -> CostConfig:
-        """コスト設定"""
-        return CostConfig(
-            commission_rate=0.001,
-            slippage_bps=10.0,
-        )
+class TestMockExchangeClientIntegration:
+    """MockExchangeClient統合テスト"""
 
     def test_mock_exchange_client_full_workflow(
         self,
-        sample_ohlcv_data: pl.DataFrame,
-        data_source_config: DataSourceConfig,
-        cost_config: CostConfig,
+        client_factory: Callable[[], MockExchangeClient],
+        assert_symbols: Callable[[pl.Series, set[str]], None],
     ) -> None:
         """load_ohlcv → set_current_datetime → submit_orders → fetch_fills → fetch_positions の一連のフロー"""
-        # セットアップ
-        data_source = MockDataSource(config=data_source_config, data=sample_ohlcv_data)
-        client = MockExchangeClient(cost_config, data_source)
-
-        # 1. OHLCVデータをロード
-        client.load_ohlcv(
-            start=datetime(2024, 1, 1),
-            end=datetime(2024, 1, 10),
-            symbols=["AAPL", "GOOGL"],
-        )
+        # 1. OHLCVロード済みのクライアントを取得
+        client = client_factory()
 
         # 2. 日付を設定
-        client.set_current_datetime(datetime(2024, 1, 1, 9, 0))
+        client.set_current_datetime(_JAN1_0900)
 
         # 3. 注文を実行
         orders = pl.DataFrame(
@@ -163,102 +129,94 @@ class TestMockExchangeClientIntegration:
         client.submit_orders(orders)
 
         # 4. 約定を取得
-        fills = client.fetch_fills(datetime(2024, 1, 1), datetime(2024, 1, 10))
+        fills = client.fetch_fills(_FETCH_START, _FETCH_END)
         assert fills.height == 2
-        assert set(fills["symbol"].to_list()) == {"AAPL", "GOOGL"}
+        assert_symbols(fills["symbol"], {"AAPL", "GOOGL"})
 
         # 5. ポジションを確認
         positions = client.fetch_positions()
         assert positions.height == 2
-        assert set(positions["symbol"].to_list()) == {"AAPL", "GOOGL"}
-
-    def test_mock_exchange_client_multiple_iterations(
+        assert_symbols(positions["symbol"], {"AAPL", "GOOGL"})
+
+    # (シナリオ名, [(iteration日時, side, 数量), ...], 期待する最終ポジション数量 / Noneはポジションなし)
+    ORDER_SCENARIOS = [
+        (
+            "multiple_iterations",  # 10 + 5 - 3 = 12株
+            [
+                (_JAN1_0900, "buy", 10.0),
+                (_JAN2_0900, "buy", 5.0),
+                (_JAN3_0900, "sell", 3.0),
+            ],
+            12.0,
+        ),
+        (
+            "short_position",  # 売りから入る: -10株
+            [(_JAN1_0900, "sell", 10.0)],
+            -10.0,
+        ),
+        (
+            "position_close",  # 全株売却でポジションなし
+            [
+                (_JAN1_0900, "buy", 10.0),
+                (_JAN2_0900, "sell", 10.0),
+            ],
+            None,
+        ),
+    ]
+
+    @pytest.mark.parametrize(
+        ("steps", "expected_qty"),
+        [pytest.param(steps, expected, id=name) for name, steps, expected in ORDER_SCENARIOS],
+    )
+    def test_position_accumulation(
         self,
-        sample_ohlcv_data: pl.DataFrame,
-        data_source_config: DataSourceConfig,
-        cost_config: CostConfig,
+        client_factory: Callable[[], MockExchangeClient],
+        steps: list[tuple[datetime, str, float]],
+        expected_qty: float | None,
     ) -> None:
-        """複数iterationでのポジション累積"""
-        # セットアップ
-        data_source = MockDataSource(config=data_source_config, data=sample_ohlcv_data)
-        client = MockExchangeClient(cost_config, data_source)
-        client.load_ohlcv(
-            start=datetime(2024, 1, 1),
-            end=datetime(2024, 1, 10),
-            symbols=["AAPL"],
-        )
-
-        # Iteration 1: 買い10株
-        client.set_current_datetime(datetime(2024, 1, 1, 9, 0))
-        orders1 = pl.DataFrame(
-            {
-                "symbol": ["AAPL"],
-                "side": ["buy"],
-                "quantity": [10.0],
-                "price": [None],
-                "order_type": ["market"],
-            }
-        )
-        client.submit_orders(orders1)
-        _ = client.fetch_fills(datetime(2024, 1, 1), datetime(2024, 1, 10))
-
-        # Iteration 2: 買い追加5株
-        client.set_current_datetime(datetime(2024, 1, 2, 9, 0))
-        orders2 = pl.DataFrame(
-            {
-                "symbol": ["AAPL"],
-                "side": ["buy"],
-                "quantity": [5.0],
-                "price": [None],
-                "order_type": ["market"],
-            }
-        )
-        client.submit_orders(orders2)
-        _ = client.fetch_fills(datetime(2024, 1, 1), datetime(2024, 1, 10))
+        """複数iterationの成行注文によるポジション累積・ショート・クローズ"""
+        client = client_factory()
 
-        # Iteration 3: 売り3株
-        client.set_current_datetime(datetime(2024, 1, 3, 9, 0))
-        orders3 = pl.DataFrame(
+        # シナリオ全体の注文をdatetime列付きの1つのDataFrameで構築し、一括投入する
+        all_orders = pl.DataFrame(
             {
-                "symbol": ["AAPL"],
-                "side": ["sell"],
-                "quantity": [3.0],
-                "price": [None],
-                "order_type": ["market"],
+                "datetime": [dt for dt, _, _ in steps],
+                "symbol": ["AAPL"] * len(steps),
+                "side": [side for _, side, _ in steps],
+                "quantity": [qty for _, _, qty in steps],
+                "price": pl.Series([None] * len(steps), dtype=pl.Float64),
+                "order_type": ["market"] * len(steps),
             }
         )
-        client.submit_orders(orders3)
-        _ = client.fetch_fills(datetime(2024, 1, 1), datetime(2024, 1, 10))
+        client.submit_orders_batch(all_orders)
+        fills = client.fetch_fills(_FETCH_START, _FETCH_END)
+        assert fills.height == len(steps)
 
-        # 最終ポジション確認: 10 + 5 - 3 = 12株
         positions = client.fetch_positions()
+        if expected_qty is None:
+            assert positions.height == 0
+            return
+
         assert positions.height == 1
-        assert positions["symbol"][0] == "AAPL"
-        assert positions["quantity"][0] == pytest.approx(12.0, rel=1e-6)
+        position = positions.row(0, named=True)
+        assert position["symbol"] == "AAPL"
+        assert position["quantity"] == pytest.approx(expected_qty, rel=1e-6)
+        # 加重平均価格は売買方向によらず正
+        assert position["avg_price"] > 0
 
     def test_mock_exchange_client_with_data_source(
         self,
-        sample_ohlcv_data: pl.DataFrame,
-        data_source_config: DataSourceConfig,
-        cost_config: CostConfig,
+        client_factory: Callable[[], MockExchangeClient],
     ) -> None:
         """DataSourceと連携したテスト"""
-        # セットアップ
-        data_source = MockDataSource(config=data_source_config, data=sample_ohlcv_data)
-        client = MockExchangeClient(cost_config, data_source)
-
-        # DataSourceからOHLCVをロード
-        client.load_ohlcv(
-            start=datetime(2024, 1, 1),
-            end=datetime(2024, 1, 10),
-            symbols=["AAPL"],
-        )
+        # セットアップ（OHLCVロード済みのクライアントを取得）
+        client = client_factory()
 
         assert client.ohlcv_cache is not None
         assert "AAPL" in client.ohlcv_cache["symbol"].to_list()
 
         # 成行注文を実行
-        client.set_current_datetime(datetime(2024, 1, 1, 9, 0))
+        client.set_current_datetime(_JAN1_0900)
         orders = pl.DataFrame(
             {
                 "symbol": ["AAPL"],
@@ -270,13 +228,13 @@ class TestMockExchangeClientIntegration:
         )
         client.submit_orders(orders)
 
-        fills = client.fetch_fills(datetime(2024, 1, 1), datetime(2024, 1, 10))
+        fills = client.fetch_fills(_FETCH_START, _FETCH_END)
         assert fills.height == 1
         # 翌バー（1/2）のopen: 105.0 + slippage
-        assert fills["filled_price"][0] > 105.0
+        assert fills.item(0, "filled_price") > 105.0
 
         # 指値注文を実行
-        client.set_current_datetime(datetime(2024, 1, 2, 9, 0))
+        client.set_current_datetime(_JAN2_0900)
         limit_orders = pl.DataFrame(
             {
                 "symbol": ["AAPL"],
@@ -289,96 +247,10 @@ class TestMockExchangeClientIntegration:
         client.submit_orders(limit_orders)
 
         # 指値注文の約定は翌バー（2024-01-03）で発生
-        fills2 = client.fetch_fills(datetime(2024, 1, 3), datetime(2024, 1, 10))
+        fills2 = client.fetch_fills(_JAN3, _FETCH_END)
         assert fills2.height == 1
-        assert fills2["filled_price"][0] == 117.0
+        assert fills2.item(0, "filled_price") == 117.0
 
         # ポジション確認: 10 - 5 = 5株
         positions = client.fetch_positions()
-        assert positions["quantity"][0] == pytest.approx(5.0, rel=1e-6)
-
-    def test_mock_exchange_client_short_position(
-        self,
-        sample_ohlcv_data: pl.DataFrame,
-        data_source_config: DataSourceConfig,
-        cost_config: CostConfig,
-    ) -> None:
-        """ショートポジション（マイナス数量）のテスト"""
-        # セットアップ
-        data_source = MockDataSource(config=data_source_config, data=sample_ohlcv_data)
-        client = MockExchangeClient(cost_config, data_source)
-        client.load_ohlcv(
-            start=datetime(2024, 1, 1),
-            end=datetime(2024, 1, 10),
-            symbols=["AAPL"],
-        )
-
-        # 売りから入る（ショートポジション）
-        client.set_current_datetime(datetime(2024, 1, 1, 9, 0))
-        orders = pl.DataFrame(
-            {
-                "symbol": ["AAPL"],
-                "side": ["sell"],
-                "quantity": [10.0],
-                "price": [None],
-                "order_type": ["market"],
-            }
-        )
-        client.submit_orders(orders)
-        _ = client.fetch_fills(datetime(2024, 1, 1), datetime(2024, 1, 10))
-
-        # ショートポジション確認: -10株
-        positions = client.fetch_positions()
-        assert positions.height == 1
-        assert positions["symbol"][0] == "AAPL"
-        assert positions["quantity"][0] == pytest.approx(-10.0, rel=1e-6)
-        # 売りの加重平均価格
-        assert positions["avg_price"][0] > 0
-
-    def test_mock_exchange_client_position_close(
-        self,
-        sample_ohlcv_data: pl.DataFrame,
-        data_source_config: DataSourceConfig,
-        cost_config: CostConfig,
-    ) -> None:
-        """ポジションクローズのテスト"""
-        # セットアップ
-        data_source = MockDataSource(config=data_source_config, data=sample_ohlcv_data)
-        client = MockExchangeClient(cost_config, data_source)
-        client.load_ohlcv(
-            start=datetime(2024, 1, 1),
-            end=datetime(2024, 1, 10),
-            symbols=["AAPL"],
-        )
-
-        # 買いポジション
-        client.set_current_datetime(datetime(2024, 1, 1, 9, 0))
-        orders1 = pl.DataFrame(
-            {
-                "symbol": ["AAPL"],
-                "side": ["buy"],
-                "quantity": [10.0],
-                "price": [None],
-                "order_type": ["market"],
-            }
-        )
-        client.submit_orders(orders1)
-        _ = client.fetch_fills(datetime(2024, 1, 1), datetime(2024, 1, 10))
-
-        # 全株売却
-        client.set_current_datetime(datetime(2024, 1, 2, 9, 0))
-        orders2 = pl.DataFrame(
-            {
-                "symbol": ["AAPL"],
-                "side": ["sell"],
-                "quantity": [10.0],
-                "price": [None],
-                "order_type": ["market"],
-            }
-        )
-        client.submit_orders(orders2)
-        _ = client.fetch_fills(datetime(2024, 1, 1), datetime(2024, 1, 10))
-
-        # ポジションなし
-        positions = client.fetch_positions()
-        assert positions.height == 0
+        assert positions.item(0, "quantity") == pytest.approx(5.0, rel=1e-6)
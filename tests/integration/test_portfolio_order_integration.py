@@ -5,16 +5,83 @@ TopNPortfolioConstructor → FullExitOrderCreator のフロー確認
 signal_strengthメタデータがエントリー注文生成で正しく参照されることを確認
 """
 
+from collections.abc import Callable
 from datetime import datetime
+from functools import lru_cache
+from typing import Any
 
 import polars as pl
+import pyarrow as pa
 import pytest
 
+_DT = datetime(2024, 1, 1)
+
+
+# スキーマ記述子: (列名, Arrow型) のタプル
+_SIGNALS_SCHEMA = (("datetime", pa.timestamp("us")), ("symbol", pa.string()), ("signal", pa.float64()))
+_POSITIONS_SCHEMA = (("symbol", pa.string()), ("quantity", pa.float64()), ("avg_price", pa.float64()))
+_OHLCV_SCHEMA = (
+    ("datetime", pa.timestamp("us")),
+    ("symbol", pa.string()),
+    ("open", pa.float64()),
+    ("high", pa.float64()),
+    ("low", pa.float64()),
+    ("close", pa.float64()),
+    ("volume", pa.int64()),
+)
+
+
+@lru_cache(maxsize=None)
+def _make_df(schema: tuple[tuple[str, pa.DataType], ...], columns: tuple[tuple[Any, ...], ...]) -> pl.DataFrame:
+    """スキーマ記述子と列データからDataFrameを構築する
+
+    Arrow配列からRecordBatchを組み立てて`pl.from_arrow`で取り込む。
+    同じ引数での呼び出しはキャッシュ済みのDataFrameを返す（テスト内で変更しないこと）。
+
+    Args:
+        schema: (列名, Arrow型) のタプル
+        columns: schemaと同じ順序の列データ
+
+    Returns:
+        構築したDataFrame
+    """
+    batch = pa.RecordBatch.from_arrays(
+        [pa.array(values, type=dtype) for values, (_, dtype) in zip(columns, schema, strict=True)],
+        names=[name for name, _ in schema],
+    )
+    df = pl.from_arrow(batch)
+    assert isinstance(df, pl.DataFrame)
+    return df
+
+
+# 複数テストで共有する入力データ（モジュール読み込み時に一度だけ構築する）
+_SIGNALS_TOP5 = _make_df(
+    _SIGNALS_SCHEMA,
+    (
+        (_DT,) * 5,
+        ("AAPL", "GOOGL", "MSFT", "AMZN", "NVDA"),
+        (0.9, 0.8, 0.7, 0.6, 0.5),
+    ),
+)
+_OHLCV_TOP3 = _make_df(
+    _OHLCV_SCHEMA,
+    (
+        (_DT,) * 3,
+        ("AAPL", "GOOGL", "MSFT"),
+        (150.0, 2500.0, 350.0),
+        (155.0, 2550.0, 355.0),
+        (148.0, 2480.0, 345.0),
+        (153.0, 2520.0, 352.0),
+        (1000000, 500000, 800000),
+    ),
+)
+_EMPTY_POSITIONS = pl.DataFrame(schema={"symbol": pl.String, "quantity": pl.Float64, "avg_price": pl.Float64})
+
 
 class TestPortfolioToEntryOrderFlow:
     """TopNPortfolioConstructor → EqualWeightEntryOrderCreator のフロー確認"""
 
-    def test_portfolio_to_entry_order_basic_flow(self) -> None:
+    def test_portfolio_to_entry_order_basic_flow(self, assert_symbols: Callable[[pl.Series, set[str]], None]) -> None:
         """基本的なフロー: ポートフォリオ構築 → エントリー注文生成"""
         from qeel.entry_order_creators.equal_weight import (
             EqualWeightEntryOrderCreator,
@@ -26,20 +93,8 @@ class TestPortfolioToEntryOrderFlow:
         )
 
         # シグナルデータ
-        signals = pl.DataFrame(
-            {
-                "datetime": [datetime(2024, 1, 1)] * 5,
-                "symbol": ["AAPL", "GOOGL", "MSFT", "AMZN", "NVDA"],
-                "signal": [0.9, 0.8, 0.7, 0.6, 0.5],
-            }
-        )
-        current_positions = pl.DataFrame(
-            {
-                "symbol": pl.Series([], dtype=pl.String),
-                "quantity": pl.Series([], dtype=pl.Float64),
-                "avg_price": pl.Series([], dtype=pl.Float64),
-            }
-        )
+        signals = _SIGNALS_TOP5
+        current_positions = _EMPTY_POSITIONS
 
         # ポートフォリオ構築: 上位3銘柄を選定
         portfolio_params = TopNConstructorParams(top_n=3)
@@ -48,21 +103,11 @@ class TestPortfolioToEntryOrderFlow:
 
         # ポートフォリオの検証
         assert portfolio.height == 3
-        assert set(portfolio["symbol"].to_list()) == {"AAPL", "GOOGL", "MSFT"}
+        assert_symbols(portfolio["symbol"], {"AAPL", "GOOGL", "MSFT"})
         assert "signal_strength" in portfolio.columns
 
         # OHLCVデータ
-        ohlcv = pl.DataFrame(
-            {
-                "datetime": [datetime(2024, 1, 1)] * 3,
-                "symbol": ["AAPL", "GOOGL", "MSFT"],
-                "open": [150.0, 2500.0, 350.0],
-                "high": [155.0, 2550.0, 355.0],
-                "low": [148.0, 2480.0, 345.0],
-                "close": [153.0, 2520.0, 352.0],
-                "volume": [1000000, 500000, 800000],
-            }
-        )
+        ohlcv = _OHLCV_TOP3
 
         # エントリー注文生成
         entry_params = EqualWeightEntryParams(capital=1_000_000.0, rebalance_threshold=0.0)
@@ -71,12 +116,14 @@ class TestPortfolioToEntryOrderFlow:
 
         # 注文の検証
         assert orders.height == 3
-        assert set(orders["symbol"].to_list()) == {"AAPL", "GOOGL", "MSFT"}
+        assert_symbols(orders["symbol"], {"AAPL", "GOOGL", "MSFT"})
         assert all(side == "buy" for side in orders["side"].to_list())
         assert all(ot == "market" for ot in orders["order_type"].to_list())
         assert all(price is None for price in orders["price"].to_list())
 
-    def test_signal_strength_used_for_side_determination(self) -> None:
+    def test_signal_strength_used_for_side_determination(
+        self, assert_symbols: Callable[[pl.Series, set[str]], None]
+    ) -> None:
         """signal_strengthを参照して買い/売りを決定することを確認"""
         from qeel.entry_order_creators.equal_weight import (
             EqualWeightEntryOrderCreator,
@@ -88,20 +135,15 @@ class TestPortfolioToEntryOrderFlow:
         )
 
         # 正と負のシグナルを含むデータ
-        signals = pl.DataFrame(
-            {
-                "datetime": [datetime(2024, 1, 1)] * 4,
-                "symbol": ["AAPL", "GOOGL", "MSFT", "AMZN"],
-                "signal": [0.9, -0.8, 0.7, -0.6],  # 絶対値でソート
-            }
-        )
-        current_positions = pl.DataFrame(
-            {
-                "symbol": pl.Series([], dtype=pl.String),
-                "quantity": pl.Series([], dtype=pl.Float64),
-                "avg_price": pl.Series([], dtype=pl.Float64),
-            }
+        signals = _make_df(
+            _SIGNALS_SCHEMA,
+            (
+                (_DT,) * 4,
+                ("AAPL", "GOOGL", "MSFT", "AMZN"),
+                (0.9, -0.8, 0.7, -0.6),  # 絶対値でソート
+            ),
         )
+        current_positions = _EMPTY_POSITIONS
 
         # ポートフォリオ構築: 上位2銘柄を選定（シグナル大きい順 = 0.9, 0.7）
         portfolio_params = TopNConstructorParams(top_n=2)
@@ -110,40 +152,37 @@ class TestPortfolioToEntryOrderFlow:
 
         assert portfolio.height == 2
         # signal降順なので、AAPL (0.9)、MSFT (0.7)が選ばれる
-        assert set(portfolio["symbol"].to_list()) == {"AAPL", "MSFT"}
-
-        ohlcv = pl.DataFrame(
-            {
-                "datetime": [datetime(2024, 1, 1)] * 2,
-                "symbol": ["AAPL", "MSFT"],
-                "open": [150.0, 350.0],
-                "high": [155.0, 355.0],
-                "low": [148.0, 345.0],
-                "close": [153.0, 352.0],
-                "volume": [1000000, 800000],
-            }
+        assert_symbols(portfolio["symbol"], {"AAPL", "MSFT"})
+
+        ohlcv = _make_df(
+            _OHLCV_SCHEMA,
+            (
+                (_DT,) * 2,
+                ("AAPL", "MSFT"),
+                (150.0, 350.0),
+                (155.0, 355.0),
+                (148.0, 345.0),
+                (153.0, 352.0),
+                (1000000, 800000),
+            ),
         )
 
         entry_params = EqualWeightEntryParams(capital=1_000_000.0, rebalance_threshold=0.0)
         entry_creator = EqualWeightEntryOrderCreator(params=entry_params)
         orders = entry_creator.create(portfolio, current_positions, ohlcv)
 
-        # 正のシグナル強度 → 買い
-        for row in orders.iter_rows(named=True):
-            symbol = row["symbol"]
-            side = row["side"]
-            signal_row = portfolio.filter(pl.col("symbol") == symbol)
-            signal_strength = signal_row["signal_strength"][0]
-            if signal_strength > 0:
-                assert side == "buy", f"{symbol}: positive signal should result in buy"
-            else:
-                assert side == "sell", f"{symbol}: negative signal should result in sell"
+        # 正のシグナル強度 → 買い、負のシグナル強度 → 売り
+        joined = orders.join(portfolio.select("symbol", "signal_strength"), on="symbol").with_columns(
+            pl.when(pl.col("signal_strength") > 0).then(pl.lit("buy")).otherwise(pl.lit("sell")).alias("expected_side")
+        )
+        assert joined.height == orders.height
+        assert (joined["side"] == joined["expected_side"]).all()
 
 
 class TestPortfolioToExitOrderFlow:
     """TopNPortfolioConstructor → FullExitOrderCreator のフロー確認"""
 
-    def test_portfolio_to_exit_order_basic_flow(self) -> None:
+    def test_portfolio_to_exit_order_basic_flow(self, assert_symbols: Callable[[pl.Series, set[str]], None]) -> None:
         """基本的なフロー: ポジションから全決済注文生成"""
         from qeel.exit_order_creators.full_exit import (
             FullExitOrderCreator,
@@ -151,24 +190,19 @@ class TestPortfolioToExitOrderFlow:
         )
 
         # 現在のポジション
-        current_positions = pl.DataFrame(
-            {
-                "symbol": ["AAPL", "GOOGL"],
-                "quantity": [100.0, 50.0],
-                "avg_price": [150.0, 2500.0],
-            }
-        )
-
-        ohlcv = pl.DataFrame(
-            {
-                "datetime": [datetime(2024, 1, 1)] * 2,
-                "symbol": ["AAPL", "GOOGL"],
-                "open": [150.0, 2500.0],
-                "high": [155.0, 2550.0],
-                "low": [148.0, 2480.0],
-                "close": [153.0, 2520.0],
-                "volume": [1000000, 500000],
-            }
+        current_positions = _make_df(_POSITIONS_SCHEMA, (("AAPL", "GOOGL"), (100.0, 50.0), (150.0, 2500.0)))
+
+        ohlcv = _make_df(
+            _OHLCV_SCHEMA,
+            (
+                (_DT,) * 2,
+                ("AAPL", "GOOGL"),
+                (150.0, 2500.0),
+                (155.0, 2550.0),
+                (148.0, 2480.0),
+                (153.0, 2520.0),
+                (1000000, 500000),
+            ),
         )
 
         # 全決済注文生成
@@ -178,7 +212,7 @@ class TestPortfolioToExitOrderFlow:
 
         # 注文の検証
         assert orders.height == 2
-        assert set(orders["symbol"].to_list()) == {"AAPL", "GOOGL"}
+        assert_symbols(orders["symbol"], {"AAPL", "GOOGL"})
         assert all(side == "sell" for side in orders["side"].to_list())
         assert all(ot == "market" for ot in orders["order_type"].to_list())
 
@@ -189,25 +223,9 @@ class TestPortfolioToExitOrderFlow:
             FullExitParams,
         )
 
-        current_positions = pl.DataFrame(
-            {
-                "symbol": ["AAPL"],
-                "quantity": [100.0],
-                "avg_price": [150.0],
-            }
-        )
+        current_positions = _make_df(_POSITIONS_SCHEMA, (("AAPL",), (100.0,), (150.0,)))
 
-        ohlcv = pl.DataFrame(
-            {
-                "datetime": [datetime(2024, 1, 1)],
-                "symbol": ["AAPL"],
-                "open": [150.0],
-                "high": [155.0],
-                "low": [148.0],
-                "close": [153.0],
-                "volume": [1000000],
-            }
-        )
+        ohlcv = _make_df(_OHLCV_SCHEMA, ((_DT,), ("AAPL",), (150.0,), (155.0,), (148.0,), (153.0,), (1000000,)))
 
         # 50%決済
         exit_params = FullExitParams(exit_threshold=0.5)
@@ -215,7 +233,7 @@ class TestPortfolioToExitOrderFlow:
         orders = exit_creator.create(current_positions, ohlcv)
 
         assert orders.height == 1
-        assert orders["quantity"][0] == pytest.approx(50.0)
+        assert orders.item(0, "quantity") == pytest.approx(50.0)
 
 
 class TestCompleteWorkflow:
@@ -237,41 +255,19 @@ class TestCompleteWorkflow:
         )
 
         # Step 1: シグナル計算結果
-        signals = pl.DataFrame(
-            {
-                "datetime": [datetime(2024, 1, 1)] * 5,
-                "symbol": ["AAPL", "GOOGL", "MSFT", "AMZN", "NVDA"],
-                "signal": [0.9, 0.8, 0.7, 0.6, 0.5],
-            }
-        )
+        signals = _SIGNALS_TOP5
 
         # Step 2: ポートフォリオ構築（上位3銘柄）
         portfolio_params = TopNConstructorParams(top_n=3)
         portfolio_constructor = TopNPortfolioConstructor(params=portfolio_params)
-        empty_positions = pl.DataFrame(
-            {
-                "symbol": pl.Series([], dtype=pl.String),
-                "quantity": pl.Series([], dtype=pl.Float64),
-                "avg_price": pl.Series([], dtype=pl.Float64),
-            }
-        )
+        empty_positions = _EMPTY_POSITIONS
         portfolio = portfolio_constructor.construct(signals, empty_positions)
 
         assert portfolio.height == 3
         assert "signal_strength" in portfolio.columns
 
         # Step 3: エントリー注文生成
-        ohlcv = pl.DataFrame(
-            {
-                "datetime": [datetime(2024, 1, 1)] * 3,
-                "symbol": ["AAPL", "GOOGL", "MSFT"],
-                "open": [150.0, 2500.0, 350.0],
-                "high": [155.0, 2550.0, 355.0],
-                "low": [148.0, 2480.0, 345.0],
-                "close": [153.0, 2520.0, 352.0],
-                "volume": [1000000, 500000, 800000],
-            }
-        )
+        ohlcv = _OHLCV_TOP3
 
         entry_params = EqualWeightEntryParams(capital=1_000_000.0, rebalance_threshold=0.0)
         entry_creator = EqualWeightEntryOrderCreator(params=entry_params)
@@ -280,15 +276,16 @@ class TestCompleteWorkflow:
         assert entry_orders.height == 3
         assert all(side == "buy" for side in entry_orders["side"].to_list())
 
-        # Step 4: ポジションを持っている状態をシミュレート
-        # 等ウェイトで3銘柄、1銘柄あたり333,333円相当
-        current_positions = pl.DataFrame(
-            {
-                "symbol": ["AAPL", "GOOGL", "MSFT"],
-                "quantity": [2222.22, 133.33, 952.38],  # capital/3/price
-                "avg_price": [150.0, 2500.0, 350.0],
-            }
+        # Step 4: エントリー注文がopen価格で全量約定した状態をシミュレート
+        # 等ウェイトで3銘柄、1銘柄あたり333,333円相当（quantity = capital/3/price）
+        # 注文とOHLCVの結合・列選択を1つのLazyFrameクエリにまとめ、collectは1回のみ
+        current_positions = (
+            entry_orders.lazy()
+            .join(ohlcv.lazy().select("symbol", pl.col("open").alias("avg_price")), on="symbol")
+            .select("symbol", "quantity", "avg_price")
+            .collect()
         )
+        assert current_positions["quantity"].sort().to_list() == pytest.approx([133.33, 952.38, 2222.22], rel=0.01)
 
         # Step 5: エグジット注文生成（全決済）
         exit_params = FullExitParams(exit_threshold=1.0)
@@ -298,7 +295,6 @@ class TestCompleteWorkflow:
         assert exit_orders.height == 3
         assert all(side == "sell" for side in exit_orders["side"].to_list())
         # 注文数量がポジション数量と一致することを確認
-        for symbol in ["AAPL", "GOOGL", "MSFT"]:
-            position_qty = current_positions.filter(pl.col("symbol") == symbol)["quantity"][0]
-            order_qty = exit_orders.filter(pl.col("symbol") == symbol)["quantity"][0]
-            assert order_qty == pytest.approx(position_qty, rel=0.01)
+        merged = exit_orders.join(current_positions, on="symbol", suffix="_pos")
+        assert merged.height == 3
+        assert merged["quantity"].to_list() == pytest.approx(merged["quantity_pos"].to_list(), rel=0.01)
@@ -7,6 +7,7 @@ MockDataSourceからデータを取得し、シグナル計算を実行する統
 from datetime import datetime
 
 import polars as pl
+import pytest
 
 from qeel.config.models import DataSourceConfig
 from qeel.data_sources.mock import MockDataSource
@@ -17,32 +18,31 @@ from qeel.examples.signals.moving_average import (
 from qeel.schemas.validators import SignalSchema
 
 
+@pytest.fixture(scope="session")
+def mock_ohlcv() -> pl.DataFrame:
+    """テスト用のモックデータ（セッションで1回だけ構築し、各テストで共有する）"""
+    dates = pl.DataFrame(
+        {"datetime": pl.datetime_range(datetime(2024, 1, 1), datetime(2024, 1, 30), "1d", eager=True)}
+    ).with_row_index("i")
+    symbols = pl.DataFrame({"symbol": ["AAPL", "GOOGL"], "base": [100.0, 200.0]})
+
+    # 銘柄×日付のcross joinから、基準価格と経過日数iの列式でOHLCVを生成する
+    price = pl.col("base") + pl.col("i") * 0.5
+    return symbols.join(dates, how="cross").select(
+        "datetime",
+        "symbol",
+        price.alias("open"),
+        (price + 1.0).alias("high"),
+        (price - 0.5).alias("low"),
+        (price + 0.3).alias("close"),
+        (1000000 + pl.col("i").cast(pl.Int64) * 10000).alias("volume"),
+    )
+
+
 class TestCalculatorWithMockDataSource:
     """MockDataSourceとの統合テスト"""
 
-    def _create_mock_data(self) -> pl.DataFrame:
-        """テスト用のモックデータを作成"""
-        dates = [datetime(2024, 1, i) for i in range(1, 31)]
-
-        data = []
-        for symbol in ["AAPL", "GOOGL"]:
-            base_price = 100.0 if symbol == "AAPL" else 200.0
-            for i, dt in enumerate(dates):
-                data.append(
-                    {
-                        "datetime": dt,
-                        "symbol": symbol,
-                        "open": base_price + i * 0.5,
-                        "high": base_price + i * 0.5 + 1.0,
-                        "low": base_price + i * 0.5 - 0.5,
-                        "close": base_price + i * 0.5 + 0.3,
-                        "volume": 1000000 + i * 10000,
-                    }
-                )
-
-        return pl.DataFrame(data)
-
-    def test_calculator_with_mock_data_source(self) -> None:
+    def test_calculator_with_mock_data_source(self, mock_ohlcv: pl.DataFrame) -> None:
         """MockDataSourceからデータを取得し、シグナル計算を実行"""
         # DataSourceConfigの設定
         config = DataSourceConfig(
@@ -55,11 +55,8 @@ class TestCalculatorWithMockDataSource:
             source_path="/mock/path",
         )
 
-        # モックデータを作成
-        mock_data = self._create_mock_data()
-
         # MockDataSourceを使用してデータを取得
-        data_source = MockDataSource(config=config, data=mock_data)
+        data_source = MockDataSource(config=config, data=mock_ohlcv)
         ohlcv = data_source.fetch(
             start=datetime(2024, 1, 1),
             end=datetime(2024, 1, 30),
@@ -79,7 +76,7 @@ class TestCalculatorWithMockDataSource:
         assert "symbol" in signals.columns
         assert "signal" in signals.columns
 
-    def test_calculator_output_schema_valid_for_context(self) -> None:
+    def test_calculator_output_schema_valid_for_context(self, mock_ohlcv: pl.DataFrame) -> None:
         """シグナル出力がSignalSchemaに準拠し、Context.signalsに設定可能な形式であることを確認
 
         Note:
@@ -97,8 +94,7 @@ class TestCalculatorWithMockDataSource:
             source_path="/mock/path",
         )
 
-        mock_data = self._create_mock_data()
-        data_source = MockDataSource(config=config, data=mock_data)
+        data_source = MockDataSource(config=config, data=mock_ohlcv)
         ohlcv = data_source.fetch(
             start=datetime(2024, 1, 1),
             end=datetime(2024, 1, 30),
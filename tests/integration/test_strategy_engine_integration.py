@@ -27,6 +27,24 @@ STANDARD_STEP_ORDER = [
     StepName.SUBMIT_ENTRY_ORDERS,
 ]
 
+# テストで使用する日時（各テストで再生成せず共有する）
+_START_DATE = datetime(2024, 1, 1)
+_TARGET_DATE = datetime(2024, 1, 2)
+_END_DATE = datetime(2024, 1, 3)
+
+# 空ブランチで返すスキーマのみのDataFrame（各呼び出しで再構築せず共有する）
+_ORDER_SCHEMA = {
+    "symbol": pl.Utf8,
+    "side": pl.Utf8,
+    "quantity": pl.Float64,
+    "price": pl.Float64,
+    "order_type": pl.Utf8,
+}
+_EMPTY_ORDERS = pl.DataFrame(schema=_ORDER_SCHEMA)
+_POSITION_SCHEMA = {"symbol": pl.Utf8, "quantity": pl.Float64, "avg_price": pl.Float64}
+_EMPTY_POSITIONS = pl.DataFrame(schema=_POSITION_SCHEMA)
+_EMPTY_FILLS = pl.DataFrame(schema={"symbol": pl.Utf8, "side": pl.Utf8, "quantity": pl.Float64})
+
 # テスト用のシンプルな実装クラス
 
 
@@ -46,6 +64,9 @@ class SimpleSignalCalculator:
                 pl.col("close").last().alias("signal"),
             ]
         )
+        # 既にDatetime型の場合はキャストしない
+        if latest.schema["datetime"] == pl.Datetime:
+            return latest
         return latest.with_columns(pl.col("datetime").cast(pl.Datetime))
 
 
@@ -73,27 +94,14 @@ class SimpleEntryOrderCreator:
         ohlcv: pl.DataFrame,
     ) -> pl.DataFrame:
         """ポートフォリオ銘柄に対して買い注文を生成"""
-        symbols = portfolio_plan["symbol"].to_list()
-
-        if not symbols:
-            return pl.DataFrame(
-                {
-                    "symbol": pl.Series([], dtype=pl.Utf8),
-                    "side": pl.Series([], dtype=pl.Utf8),
-                    "quantity": pl.Series([], dtype=pl.Float64),
-                    "price": pl.Series([], dtype=pl.Float64),
-                    "order_type": pl.Series([], dtype=pl.Utf8),
-                }
-            )
-
-        return pl.DataFrame(
-            {
-                "symbol": symbols,
-                "side": ["buy"] * len(symbols),
-                "quantity": [10.0] * len(symbols),
-                "price": [None] * len(symbols),
-                "order_type": ["market"] * len(symbols),
-            }
+        if portfolio_plan.height == 0:
+            return _EMPTY_ORDERS
+
+        return portfolio_plan.select("symbol").with_columns(
+            side=pl.lit("buy"),
+            quantity=pl.lit(10.0),
+            price=pl.lit(None, dtype=pl.Float64),
+            order_type=pl.lit("market"),
         )
 
 
@@ -106,37 +114,15 @@ class SimpleExitOrderCreator:
     def create(self, current_positions: pl.DataFrame, ohlcv: pl.DataFrame) -> pl.DataFrame:
         """保有ポジションに対して売り注文を生成"""
         if current_positions.height == 0:
-            return pl.DataFrame(
-                {
-                    "symbol": pl.Series([], dtype=pl.Utf8),
-                    "side": pl.Series([], dtype=pl.Utf8),
-                    "quantity": pl.Series([], dtype=pl.Float64),
-                    "price": pl.Series([], dtype=pl.Float64),
-                    "order_type": pl.Series([], dtype=pl.Utf8),
-                }
-            )
-
-        # quantityが正の場合のみ決済
-        positions_to_exit = current_positions.filter(pl.col("quantity") > 0)
-        if positions_to_exit.height == 0:
-            return pl.DataFrame(
-                {
-                    "symbol": pl.Series([], dtype=pl.Utf8),
-                    "side": pl.Series([], dtype=pl.Utf8),
-                    "quantity": pl.Series([], dtype=pl.Float64),
-                    "price": pl.Series([], dtype=pl.Float64),
-                    "order_type": pl.Series([], dtype=pl.Utf8),
-                }
-            )
-
-        return pl.DataFrame(
-            {
-                "symbol": positions_to_exit["symbol"].to_list(),
-                "side": ["sell"] * positions_to_exit.height,
-                "quantity": positions_to_exit["quantity"].to_list(),
-                "price": [None] * positions_to_exit.height,
-                "order_type": ["market"] * positions_to_exit.height,
-            }
+            return _EMPTY_ORDERS
+
+        # SimpleExchangeClientはquantityが正のポジションのみ保持するため、絞り込みは不要
+        return current_positions.select(
+            "symbol",
+            side=pl.lit("sell"),
+            quantity=pl.col("quantity"),
+            price=pl.lit(None, dtype=pl.Float64),
+            order_type=pl.lit("market"),
         )
 
 
@@ -144,7 +130,9 @@ class SimpleDataSource:
     """シンプルなデータソース（テスト用）"""
 
     def __init__(self, data: pl.DataFrame) -> None:
-        self.data = data
+        # datetimeで事前にソートし、fetchでは二分探索で期間の境界を求める
+        self.data = data.sort("datetime")
+        self._datetimes = self.data["datetime"]
         self.config = type(
             "Config",
             (),
@@ -158,91 +146,76 @@ class SimpleDataSource:
 
     def fetch(self, start: datetime, end: datetime, symbols: list[str]) -> pl.DataFrame:
         """指定期間・銘柄のデータを返す"""
-        result = self.data.filter(
-            (pl.col("datetime") >= start)
-            & (pl.col("datetime") <= end)
-            & (pl.col("symbol").is_in(symbols) if symbols else pl.lit(True))
-        )
-        return result
+        lo = self._datetimes.search_sorted(start, side="left")
+        hi = self._datetimes.search_sorted(end, side="right")
+        window = self.data.slice(lo, hi - lo)
+        # symbolsが空の場合は銘柄条件を付けない（常にTrueの列を作らない）
+        if symbols:
+            window = window.filter(pl.col("symbol").is_in(symbols))
+        return window
 
 
 class SimpleExchangeClient:
     """シンプルな取引所クライアント（テスト用）"""
 
     def __init__(self) -> None:
-        self.positions: dict[str, dict[str, float]] = {}
-        self.fill_history: list[dict[str, object]] = []
+        self.positions = _EMPTY_POSITIONS
+        # 約定履歴は注文DataFrameをvstackで積み上げる
+        self.fill_history = _EMPTY_FILLS
 
     def fetch_positions(self) -> pl.DataFrame:
         """現在のポジションを返す"""
-        if not self.positions:
-            return pl.DataFrame(
-                {
-                    "symbol": pl.Series([], dtype=pl.Utf8),
-                    "quantity": pl.Series([], dtype=pl.Float64),
-                    "avg_price": pl.Series([], dtype=pl.Float64),
-                }
-            )
+        return self.positions
 
-        return pl.DataFrame(
-            {
-                "symbol": list(self.positions.keys()),
-                "quantity": [p["quantity"] for p in self.positions.values()],
-                "avg_price": [p["avg_price"] for p in self.positions.values()],
-            }
+    def submit_orders(self, orders: pl.DataFrame) -> None:
+        """注文を銘柄ごとに集計し、ポジションへ一括で反映する"""
+        self.fill_history = self.fill_history.vstack(orders.select("symbol", "side", "quantity"))
+
+        is_buy = pl.col("side") == "buy"
+        delta = orders.group_by("symbol", maintain_order=True).agg(
+            pl.when(is_buy).then(pl.col("quantity")).otherwise(-pl.col("quantity")).sum().alias("delta"),
+            is_buy.any().alias("bought"),
         )
 
-    def submit_orders(self, orders: pl.DataFrame) -> None:
-        """注文を処理してポジションを更新"""
-        for row in orders.to_dicts():
-            symbol = row["symbol"]
-            side = row["side"]
-            quantity = row["quantity"]
-
-            if symbol not in self.positions:
-                self.positions[symbol] = {"quantity": 0.0, "avg_price": 0.0}
-
-            if side == "buy":
-                self.positions[symbol]["quantity"] += quantity
-                self.positions[symbol]["avg_price"] = 100.0  # ダミー価格
-            else:  # sell
-                self.positions[symbol]["quantity"] -= quantity
-
-            self.fill_history.append(
-                {
-                    "symbol": symbol,
-                    "side": side,
-                    "quantity": quantity,
-                }
+        self.positions = (
+            self.positions.join(delta, on="symbol", how="full", coalesce=True, maintain_order="left_right")
+            .select(
+                "symbol",
+                (pl.col("quantity").fill_null(0.0) + pl.col("delta").fill_null(0.0)).alias("quantity"),
+                # 買いがあった銘柄はダミー価格
+                pl.when(pl.col("bought")).then(100.0).otherwise(pl.col("avg_price").fill_null(0.0)).alias("avg_price"),
             )
-
-            # quantityが0になったらポジションを削除
-            if self.positions[symbol]["quantity"] == 0:
-                del self.positions[symbol]
+            # ロングのみを扱うため、quantityが正のポジションだけを保持する
+            .filter(pl.col("quantity") > 0)
+        )
 
 
 # フィクスチャ
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def sample_ohlcv_data() -> pl.DataFrame:
-    """テスト用OHLCVデータ（2銘柄、3日分）"""
-    data = []
-    for day in range(1, 4):
-        for symbol in ["AAPL", "GOOGL"]:
-            data.append(
-                {
-                    "datetime": datetime(2024, 1, day),
-                    "symbol": symbol,
-                    "open": 100.0 + day,
-                    "high": 105.0 + day,
-                    "low": 99.0 + day,
-                    "close": 104.0 + day,
-                    "volume": 1000000,
-                }
-            )
-
-    return pl.DataFrame(data).with_columns(pl.col("datetime").cast(pl.Datetime))
+    """テスト用OHLCVデータ（2銘柄、3日分）
+
+    行ごとのdictを積み上げず、日付×銘柄のcross joinと列式で列指向に構築する。
+    セッション内で共有するため、datetime順にソートした単一チャンクの状態で固定する。
+    """
+    days = pl.DataFrame({"datetime": pl.datetime_range(_START_DATE, _END_DATE, "1d", eager=True)})
+    symbols = pl.DataFrame({"symbol": ["AAPL", "GOOGL"]})
+    day = pl.col("datetime").dt.day().cast(pl.Float64)
+
+    return (
+        days.join(symbols, how="cross")
+        .with_columns(
+            (100.0 + day).alias("open"),
+            (105.0 + day).alias("high"),
+            (99.0 + day).alias("low"),
+            (104.0 + day).alias("close"),
+            pl.lit(1000000, dtype=pl.Int64).alias("volume"),
+        )
+        .sort("datetime")
+        .rechunk()
+    )
 
 
 @pytest.fixture
@@ -267,33 +240,48 @@ def sample_config() -> Config:
         costs=CostConfig(),
         loop=LoopConfig(
             frequency="1d",
-            start_date=datetime(2024, 1, 1),
-            end_date=datetime(2024, 1, 3),
+            start_date=_START_DATE,
+            end_date=_END_DATE,
             universe=["AAPL", "GOOGL"],
         ),
     )
 
 
+# 各コンポーネントはステートレスなため、エンジン間で同一インスタンスを共有する
+_SIGNAL_CALCULATOR = SimpleSignalCalculator()
+_PORTFOLIO_CONSTRUCTOR = SimplePortfolioConstructor()
+_ENTRY_ORDER_CREATOR = SimpleEntryOrderCreator()
+_EXIT_ORDER_CREATOR = SimpleExitOrderCreator()
+
+
+def _make_engine(
+    config: Config,
+    data_source: SimpleDataSource,
+    exchange_client: SimpleExchangeClient,
+    context_store: InMemoryStore,
+) -> StrategyEngine:
+    """シンプルなコンポーネントでStrategyEngineを組み立てる"""
+    return StrategyEngine(
+        config=config,
+        data_sources={"ohlcv": data_source},  # type: ignore
+        signal_calculator=_SIGNAL_CALCULATOR,  # type: ignore
+        portfolio_constructor=_PORTFOLIO_CONSTRUCTOR,  # type: ignore
+        entry_order_creator=_ENTRY_ORDER_CREATOR,  # type: ignore
+        exit_order_creator=_EXIT_ORDER_CREATOR,  # type: ignore
+        exchange_client=exchange_client,  # type: ignore
+        context_store=context_store,
+    )
+
+
 @pytest.fixture
 def strategy_engine_with_simple_components(
     sample_ohlcv_data: pl.DataFrame,
     sample_config: Config,
 ) -> tuple[StrategyEngine, SimpleExchangeClient, InMemoryStore]:
     """シンプルなコンポーネントを使用したStrategyEngine"""
-    data_source = SimpleDataSource(sample_ohlcv_data)
     exchange_client = SimpleExchangeClient()
     context_store = InMemoryStore()
-
-    engine = StrategyEngine(
-        config=sample_config,
-        data_sources={"ohlcv": data_source},  # type: ignore
-        signal_calculator=SimpleSignalCalculator(),  # type: ignore
-        portfolio_constructor=SimplePortfolioConstructor(),  # type: ignore
-        entry_order_creator=SimpleEntryOrderCreator(),  # type: ignore
-        exit_order_creator=SimpleExitOrderCreator(),  # type: ignore
-        exchange_client=exchange_client,  # type: ignore
-        context_store=context_store,
-    )
+    engine = _make_engine(sample_config, SimpleDataSource(sample_ohlcv_data), exchange_client, context_store)
 
     return engine, exchange_client, context_store
 
@@ -307,7 +295,7 @@ class TestStrategyEngineE2E:
     ) -> None:
         """run_stepsで全ステップ実行時にシグナル・ポートフォリオ・注文を正しく生成すること"""
         engine, exchange_client, context_store = strategy_engine_with_simple_components
-        target_date = datetime(2024, 1, 2)
+        target_date = _TARGET_DATE
 
         engine.run_steps(target_date, STANDARD_STEP_ORDER)
 
@@ -324,7 +312,7 @@ class TestStrategyEngineE2E:
         assert engine._context.entry_orders.height > 0
 
         # 約定履歴に追加されていること
-        assert len(exchange_client.fill_history) > 0
+        assert exchange_client.fill_history.height > 0
 
     def test_run_steps_updates_positions(
         self,
@@ -332,7 +320,7 @@ class TestStrategyEngineE2E:
     ) -> None:
         """run_stepsで全ステップ実行時にポジションを正しく更新すること"""
         engine, exchange_client, context_store = strategy_engine_with_simple_components
-        target_date = datetime(2024, 1, 2)
+        target_date = _TARGET_DATE
 
         engine.run_steps(target_date, STANDARD_STEP_ORDER)
 
@@ -352,7 +340,7 @@ class TestStrategyEngineMultipleIterations:
         engine, exchange_client, context_store = strategy_engine_with_simple_components
 
         # Day 1
-        day1 = datetime(2024, 1, 1)
+        day1 = _START_DATE
         engine.run_steps(day1, STANDARD_STEP_ORDER)
 
         # Day 1終了時点でポジションが存在することを確認
@@ -360,7 +348,7 @@ class TestStrategyEngineMultipleIterations:
         assert positions_after_day1.height > 0
 
         # Day 2 (エグジットしないので追加注文)
-        day2 = datetime(2024, 1, 2)
+        day2 = _TARGET_DATE
         engine.run_steps(day2, STANDARD_STEP_ORDER)
 
         positions_after_day2 = exchange_client.fetch_positions()
@@ -369,7 +357,21 @@ class TestStrategyEngineMultipleIterations:
         assert positions_after_day2.height > 0
 
         # 約定履歴に両日分が含まれていること
-        assert len(exchange_client.fill_history) >= 2  # 少なくとも2回の注文
+        assert exchange_client.fill_history.height >= 2  # 少なくとも2回の注文
+
+    def test_run_range_accumulates_positions(
+        self,
+        strategy_engine_with_simple_components: tuple[StrategyEngine, SimpleExchangeClient, InMemoryStore],
+    ) -> None:
+        """run_rangeで複数日をまとめて実行してもポジションが累積すること"""
+        engine, exchange_client, context_store = strategy_engine_with_simple_components
+
+        engine.run_range(_START_DATE, _TARGET_DATE, STANDARD_STEP_ORDER)
+
+        assert exchange_client.fetch_positions().height > 0
+        assert exchange_client.fill_history.height >= 2
+        assert engine._context is not None
+        assert engine._context.current_datetime == _TARGET_DATE
 
 
 class TestStrategyEngineContextPersistence:
@@ -383,7 +385,7 @@ class TestStrategyEngineContextPersistence:
     ) -> None:
         """部分実行後に新しいエンジンで再開できること"""
         engine, exchange_client, context_store = strategy_engine_with_simple_components
-        target_date = datetime(2024, 1, 2)
+        target_date = _TARGET_DATE
 
         # 部分実行（シグナル計算とポートフォリオ構築のみ）
         # run_step内で自動的にload_contextが呼ばれる
@@ -396,17 +398,8 @@ class TestStrategyEngineContextPersistence:
         assert engine._context.portfolio_plan is not None
 
         # 新しいエンジンを作成してコンテキストを復元
-        data_source = SimpleDataSource(sample_ohlcv_data)
-        new_engine = StrategyEngine(
-            config=sample_config,
-            data_sources={"ohlcv": data_source},  # type: ignore
-            signal_calculator=SimpleSignalCalculator(),  # type: ignore
-            portfolio_constructor=SimplePortfolioConstructor(),  # type: ignore
-            entry_order_creator=SimpleEntryOrderCreator(),  # type: ignore
-            exit_order_creator=SimpleExitOrderCreator(),  # type: ignore
-            exchange_client=exchange_client,  # type: ignore
-            context_store=context_store,  # 同じストアを使用
-        )
+        # 同じExchangeClientとストアを使用
+        new_engine = _make_engine(sample_config, SimpleDataSource(sample_ohlcv_data), exchange_client, context_store)
 
         # 残りのステップを実行（run_step内で自動的にload_contextが呼ばれる）
         new_engine.run_step(target_date, StepName.CREATE_EXIT_ORDERS)
@@ -415,7 +408,7 @@ class TestStrategyEngineContextPersistence:
         new_engine.run_step(target_date, StepName.SUBMIT_ENTRY_ORDERS)
 
         # 注文が実行されたこと
-        assert len(exchange_client.fill_history) > 0
+        assert exchange_client.fill_history.height > 0
 
         # 新エンジンでもsignalsとportfolio_planがロードされていること
         assert new_engine._context is not None
@@ -428,7 +421,7 @@ class TestStrategyEngineContextPersistence:
     ) -> None:
         """単一ステップを独立して実行できること（実運用想定）"""
         engine, exchange_client, context_store = strategy_engine_with_simple_components
-        target_date = datetime(2024, 1, 2)
+        target_date = _TARGET_DATE
 
         # calculate_signalsのみ実行（run_step内で自動的にload_contextが呼ばれる）
         engine.run_step(target_date, StepName.CALCULATE_SIGNALS)
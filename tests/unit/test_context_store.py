@@ -7,6 +7,35 @@ import polars as pl
 import pytest
 
 from qeel.io.in_memory import InMemoryIO
+from qeel.stores.context_store import ContextStore
+from qeel.stores.in_memory import InMemoryStore
+
+# 各テストで読み取り専用に共有するデータ（モジュール読み込み時に一度だけ構築する）
+_TARGET_DATETIME = datetime(2025, 1, 15)
+_SIGNALS_DF = pl.DataFrame({"datetime": [_TARGET_DATETIME], "symbol": ["AAPL"], "signal": [0.5]})
+_PORTFOLIO_PLAN_DF = pl.DataFrame({"datetime": [_TARGET_DATETIME], "symbol": ["AAPL"], "signal_strength": [0.8]})
+_ENTRY_ORDERS_DF = pl.DataFrame(
+    {"symbol": ["AAPL"], "side": ["buy"], "quantity": [100.0], "price": [150.0], "order_type": ["limit"]}
+)
+_EXIT_ORDERS_DF = pl.DataFrame(
+    {"symbol": ["GOOGL"], "side": ["sell"], "quantity": [50.0], "price": [2800.0], "order_type": ["market"]}
+)
+_POSITIONS_DF = pl.DataFrame(
+    {
+        "symbol": ["AAPL", "GOOGL"],
+        "quantity": [100.0, 50.0],
+        "avg_price": [150.0, 2800.0],
+    }
+)
+_SINGLE_POSITION_DF = pl.DataFrame({"symbol": ["AAPL"], "quantity": [100.0], "avg_price": [150.0]})
+_EMPTY_POSITIONS_DF = pl.DataFrame(schema={"symbol": pl.String, "quantity": pl.Float64, "avg_price": pl.Float64})
+
+
+class _StubExchangeClient:
+    """fetch_positions()のみを持つ軽量なExchangeClientスタブ"""
+
+    def fetch_positions(self) -> pl.DataFrame:
+        return _POSITIONS_DF
 
 
 class TestContextStore:
@@ -18,148 +47,96 @@ class TestContextStore:
         return InMemoryIO()
 
     @pytest.fixture
-    def mock_exchange_client(self) -> MagicMock:
-        """モックExchangeClient"""
-        client = MagicMock()
-        client.fetch_positions.return_value = pl.DataFrame(
-            {
-                "symbol": ["AAPL", "GOOGL"],
-                "quantity": [100.0, 50.0],
-                "avg_price": [150.0, 2800.0],
-            }
-        )
-        return client
-
-    def test_context_store_save_signals(self, io: InMemoryIO) -> None:
-        """シグナルを日付パーティショニングで保存"""
-        from qeel.stores.context_store import ContextStore
-
-        store = ContextStore(io)
-        target_datetime = datetime(2025, 1, 15)
-        signals = pl.DataFrame(
-            {
-                "datetime": [target_datetime],
-                "symbol": ["AAPL"],
-                "signal": [0.5],
-            }
-        )
-
-        store.save_signals(target_datetime, signals)
+    def store(self, io: InMemoryIO) -> ContextStore:
+        """テスト用ContextStore"""
+        return ContextStore(io)
+
+    @pytest.fixture(scope="session")
+    def mock_exchange_client(self) -> _StubExchangeClient:
+        """モックExchangeClient（呼び出し回数を検証しないためスタブをセッションで共有）"""
+        return _StubExchangeClient()
+
+    @pytest.mark.parametrize(
+        ("method", "data", "component_name"),
+        [
+            ("save_signals", _SIGNALS_DF, "signals"),
+            ("save_portfolio_plan", _PORTFOLIO_PLAN_DF, "portfolio_plan"),
+            ("save_entry_orders", _ENTRY_ORDERS_DF, "entry_orders"),
+            ("save_exit_orders", _EXIT_ORDERS_DF, "exit_orders"),
+        ],
+    )
+    def test_context_store_save_component(
+        self, store: ContextStore, io: InMemoryIO, method: str, data: pl.DataFrame, component_name: str
+    ) -> None:
+        """各要素を日付パーティショニングで保存"""
+        getattr(store, method)(_TARGET_DATETIME, data)
 
         # IOに保存されていることを確認
-        expected_path = "memory://outputs/context/2025/01/signals_2025-01-15.parquet"
-        assert io.exists(expected_path)
-
-    def test_context_store_save_portfolio_plan(self, io: InMemoryIO) -> None:
-        """ポートフォリオ計画を保存"""
-        from qeel.stores.context_store import ContextStore
-
-        store = ContextStore(io)
-        target_datetime = datetime(2025, 1, 15)
-        portfolio_plan = pl.DataFrame(
-            {
-                "datetime": [target_datetime],
-                "symbol": ["AAPL"],
-                "signal_strength": [0.8],
-            }
-        )
-
-        store.save_portfolio_plan(target_datetime, portfolio_plan)
-
-        expected_path = "memory://outputs/context/2025/01/portfolio_plan_2025-01-15.parquet"
+        expected_path = f"memory://outputs/context/2025/01/{component_name}_2025-01-15.parquet"
         assert io.exists(expected_path)
 
-    def test_context_store_save_entry_orders(self, io: InMemoryIO) -> None:
-        """エントリー注文を保存"""
-        from qeel.stores.context_store import ContextStore
-
-        store = ContextStore(io)
-        target_datetime = datetime(2025, 1, 15)
-        entry_orders = pl.DataFrame(
+    def test_context_store_save_signals_batch(self, store: ContextStore, io: InMemoryIO) -> None:
+        """複数日付のシグナルを日付ごとに分割して保存"""
+        signals = pl.DataFrame(
             {
-                "symbol": ["AAPL"],
-                "side": ["buy"],
-                "quantity": [100.0],
-                "price": [150.0],
-                "order_type": ["limit"],
+                "datetime": [datetime(2025, 1, 15), datetime(2025, 1, 15), datetime(2025, 2, 3)],
+                "symbol": ["AAPL", "GOOGL", "AAPL"],
+                "signal": [0.5, 0.3, 0.7],
             }
         )
 
-        store.save_entry_orders(target_datetime, entry_orders)
+        store.save_signals_batch(signals)
 
-        expected_path = "memory://outputs/context/2025/01/entry_orders_2025-01-15.parquet"
-        assert io.exists(expected_path)
+        jan = io.load("memory://outputs/context/2025/01/signals_2025-01-15.parquet", format="parquet")
+        feb = io.load("memory://outputs/context/2025/02/signals_2025-02-03.parquet", format="parquet")
+        assert isinstance(jan, pl.DataFrame)
+        assert isinstance(feb, pl.DataFrame)
+        assert jan.columns == ["datetime", "symbol", "signal"]
+        assert jan["symbol"].to_list() == ["AAPL", "GOOGL"]
+        assert feb["signal"].to_list() == [0.7]
 
-    def test_context_store_save_exit_orders(self, io: InMemoryIO) -> None:
-        """エグジット注文を保存"""
-        from qeel.stores.context_store import ContextStore
+    def test_context_store_save_signals_batch_requires_datetime(self, store: ContextStore) -> None:
+        """datetime列がない場合はValueError"""
+        signals = pl.DataFrame({"symbol": ["AAPL"], "signal": [0.5]})
 
-        store = ContextStore(io)
-        target_datetime = datetime(2025, 1, 15)
-        exit_orders = pl.DataFrame(
-            {
-                "symbol": ["GOOGL"],
-                "side": ["sell"],
-                "quantity": [50.0],
-                "price": [2800.0],
-                "order_type": ["market"],
-            }
-        )
+        with pytest.raises(ValueError, match="datetime列"):
+            store.save_signals_batch(signals)
 
-        store.save_exit_orders(target_datetime, exit_orders)
-
-        expected_path = "memory://outputs/context/2025/01/exit_orders_2025-01-15.parquet"
-        assert io.exists(expected_path)
-
-    def test_context_store_load_returns_context(self, io: InMemoryIO, mock_exchange_client: MagicMock) -> None:
+    def test_context_store_load_returns_context(
+        self, store: ContextStore, mock_exchange_client: _StubExchangeClient
+    ) -> None:
         """指定日付のコンテキストを復元"""
-        from qeel.stores.context_store import ContextStore
-
-        store = ContextStore(io)
-        target_datetime = datetime(2025, 1, 15)
-
         # データを保存
-        signals = pl.DataFrame({"datetime": [target_datetime], "symbol": ["AAPL"], "signal": [0.5]})
-        portfolio_plan = pl.DataFrame({"datetime": [target_datetime], "symbol": ["AAPL"], "signal_strength": [0.8]})
-        store.save_signals(target_datetime, signals)
-        store.save_portfolio_plan(target_datetime, portfolio_plan)
+        store.save_signals(_TARGET_DATETIME, _SIGNALS_DF)
+        store.save_portfolio_plan(_TARGET_DATETIME, _PORTFOLIO_PLAN_DF)
 
         # 読み込み
-        ctx = store.load(target_datetime, mock_exchange_client)
+        ctx = store.load(_TARGET_DATETIME, mock_exchange_client)
 
         assert ctx is not None
-        assert ctx.current_datetime == target_datetime
+        assert ctx.current_datetime == _TARGET_DATETIME
         assert ctx.signals is not None
         assert ctx.signals.shape[0] == 1
         assert ctx.portfolio_plan is not None
         assert ctx.current_positions is not None
 
     def test_context_store_load_returns_none_when_not_exists(
-        self, io: InMemoryIO, mock_exchange_client: MagicMock
+        self, store: ContextStore, mock_exchange_client: _StubExchangeClient
     ) -> None:
         """保存された要素がない場合None"""
-        from qeel.stores.context_store import ContextStore
-
-        store = ContextStore(io)
-        target_datetime = datetime(2025, 1, 15)
-
-        ctx = store.load(target_datetime, mock_exchange_client)
+        ctx = store.load(_TARGET_DATETIME, mock_exchange_client)
 
         assert ctx is None
 
-    def test_context_store_load_partial_elements(self, io: InMemoryIO, mock_exchange_client: MagicMock) -> None:
+    def test_context_store_load_partial_elements(
+        self, store: ContextStore, mock_exchange_client: _StubExchangeClient
+    ) -> None:
         """一部の要素のみ存在する場合も正常に復元"""
-        from qeel.stores.context_store import ContextStore
-
-        store = ContextStore(io)
-        target_datetime = datetime(2025, 1, 15)
-
         # signalsのみ保存
-        signals = pl.DataFrame({"datetime": [target_datetime], "symbol": ["AAPL"], "signal": [0.5]})
-        store.save_signals(target_datetime, signals)
+        store.save_signals(_TARGET_DATETIME, _SIGNALS_DF)
 
         # 読み込み
-        ctx = store.load(target_datetime, mock_exchange_client)
+        ctx = store.load(_TARGET_DATETIME, mock_exchange_client)
 
         assert ctx is not None
         assert ctx.signals is not None
@@ -169,18 +146,19 @@ class TestContextStore:
         assert ctx.current_positions is not None
 
     def test_context_store_load_latest_returns_most_recent(
-        self, io: InMemoryIO, mock_exchange_client: MagicMock
+        self, store: ContextStore, mock_exchange_client: _StubExchangeClient
     ) -> None:
         """最新日付のコンテキストを復元"""
-        from qeel.stores.context_store import ContextStore
-
-        store = ContextStore(io)
-
-        # 複数日付のデータを保存
-        for day in [10, 15, 20]:
-            dt = datetime(2025, 1, day)
-            signals = pl.DataFrame({"datetime": [dt], "symbol": ["AAPL"], "signal": [day / 100]})
-            store.save_signals(dt, signals)
+        # 複数日付のデータを一括保存
+        days = [10, 15, 20]
+        signals = pl.DataFrame(
+            {
+                "datetime": [datetime(2025, 1, day) for day in days],
+                "symbol": ["AAPL"] * len(days),
+                "signal": [day / 100 for day in days],
+            }
+        )
+        store.save_signals_batch(signals)
 
         # 最新を読み込み
         ctx = store.load_latest(mock_exchange_client)
@@ -189,57 +167,40 @@ class TestContextStore:
         assert ctx.current_datetime == datetime(2025, 1, 20)
 
     def test_context_store_load_latest_returns_none_when_empty(
-        self, io: InMemoryIO, mock_exchange_client: MagicMock
+        self, store: ContextStore, mock_exchange_client: _StubExchangeClient
     ) -> None:
         """保存データがない場合None"""
-        from qeel.stores.context_store import ContextStore
-
-        store = ContextStore(io)
-
         ctx = store.load_latest(mock_exchange_client)
 
         assert ctx is None
 
-    def test_context_store_exists_returns_true(self, io: InMemoryIO) -> None:
+    def test_context_store_exists_returns_true(self, store: ContextStore) -> None:
         """コンテキストが存在する場合True"""
-        from qeel.stores.context_store import ContextStore
+        store.save_signals(_TARGET_DATETIME, _SIGNALS_DF)
 
-        store = ContextStore(io)
-        target_datetime = datetime(2025, 1, 15)
+        assert store.exists(_TARGET_DATETIME) is True
 
-        signals = pl.DataFrame({"datetime": [target_datetime], "symbol": ["AAPL"], "signal": [0.5]})
-        store.save_signals(target_datetime, signals)
-
-        assert store.exists(target_datetime) is True
-
-    def test_context_store_exists_returns_false(self, io: InMemoryIO) -> None:
+    def test_context_store_exists_returns_false(self, store: ContextStore) -> None:
         """コンテキストが存在しない場合False"""
-        from qeel.stores.context_store import ContextStore
-
-        store = ContextStore(io)
-        target_datetime = datetime(2025, 1, 15)
-
-        assert store.exists(target_datetime) is False
-
-    def test_context_store_partition_directory_format(self, io: InMemoryIO) -> None:
+        assert store.exists(_TARGET_DATETIME) is False
+
+    @pytest.mark.parametrize(
+        ("target_datetime", "expected_path"),
+        [
+            (datetime(2025, 1, 15), "memory://outputs/context/2025/01/signals_2025-01-15.parquet"),
+            (datetime(2025, 2, 20), "memory://outputs/context/2025/02/signals_2025-02-20.parquet"),
+            (datetime(2024, 12, 31), "memory://outputs/context/2024/12/signals_2024-12-31.parquet"),
+            (datetime(2025, 12, 1), "memory://outputs/context/2025/12/signals_2025-12-01.parquet"),
+        ],
+    )
+    def test_context_store_partition_directory_format(
+        self, store: ContextStore, io: InMemoryIO, target_datetime: datetime, expected_path: str
+    ) -> None:
         """年月パーティション形式（YYYY/MM/）の確認"""
-        from qeel.stores.context_store import ContextStore
-
-        store = ContextStore(io)
-
-        # 異なる月のデータを保存
-        jan = datetime(2025, 1, 15)
-        feb = datetime(2025, 2, 20)
-
-        store.save_signals(jan, pl.DataFrame({"datetime": [jan], "symbol": ["AAPL"], "signal": [0.5]}))
-        store.save_signals(feb, pl.DataFrame({"datetime": [feb], "symbol": ["AAPL"], "signal": [0.6]}))
+        store.save_signals(target_datetime, _SIGNALS_DF.with_columns(pl.Series("datetime", [target_datetime])))
 
         # パーティションディレクトリが正しいことを確認
-        jan_path = "memory://outputs/context/2025/01/signals_2025-01-15.parquet"
-        feb_path = "memory://outputs/context/2025/02/signals_2025-02-20.parquet"
-
-        assert io.exists(jan_path)
-        assert io.exists(feb_path)
+        assert io.exists(expected_path)
 
 
 class TestInMemoryStore:
@@ -247,36 +208,24 @@ class TestInMemoryStore:
 
     @pytest.fixture
     def mock_exchange_client(self) -> MagicMock:
-        """モックExchangeClient"""
+        """モックExchangeClient（fetch_positionsの呼び出し回数を検証するためテストごとに生成）"""
         client = MagicMock()
-        client.fetch_positions.return_value = pl.DataFrame(
-            {
-                "symbol": ["AAPL"],
-                "quantity": [100.0],
-                "avg_price": [150.0],
-            }
-        )
+        client.fetch_positions.return_value = _SINGLE_POSITION_DF
         return client
 
     def test_in_memory_store_save_and_load(self, mock_exchange_client: MagicMock) -> None:
         """最新コンテキストのみ保持"""
-        from qeel.stores.in_memory import InMemoryStore
-
         store = InMemoryStore()
-        target_datetime = datetime(2025, 1, 15)
 
-        signals = pl.DataFrame({"datetime": [target_datetime], "symbol": ["AAPL"], "signal": [0.5]})
-        store.save_signals(target_datetime, signals)
+        store.save_signals(_TARGET_DATETIME, _SIGNALS_DF)
 
-        ctx = store.load(target_datetime, mock_exchange_client)
+        ctx = store.load(_TARGET_DATETIME, mock_exchange_client)
 
         assert ctx is not None
         assert ctx.signals is not None
 
     def test_in_memory_store_overwrites_previous(self, mock_exchange_client: MagicMock) -> None:
         """上書き動作の確認"""
-        from qeel.stores.in_memory import InMemoryStore
-
         store = InMemoryStore()
 
         # 最初のデータ
@@ -298,30 +247,93 @@ class TestInMemoryStore:
 
     def test_in_memory_store_load_latest(self, mock_exchange_client: MagicMock) -> None:
         """load_latestが最新を返す"""
-        from qeel.stores.in_memory import InMemoryStore
+        store = InMemoryStore()
+
+        store.save_signals(_TARGET_DATETIME, _SIGNALS_DF)
+
+        ctx = store.load_latest(mock_exchange_client)
+
+        assert ctx is not None
+        assert ctx.current_datetime == _TARGET_DATETIME
 
+    def test_in_memory_store_refetches_positions_after_exchange_change(self, mock_exchange_client: MagicMock) -> None:
+        """load()のたびにfetch_positions()を呼び、約定後のポジション変化を反映する"""
         store = InMemoryStore()
-        target_datetime = datetime(2025, 1, 15)
+        dt2 = datetime(2025, 1, 16)
+
+        store.save_exit_orders(_TARGET_DATETIME, _EXIT_ORDERS_DF)
+        mock_exchange_client.fetch_positions.return_value = _EMPTY_POSITIONS_DF
+        ctx1 = store.load(_TARGET_DATETIME, mock_exchange_client)
+
+        assert ctx1 is not None
+        assert ctx1.current_positions is not None
+        assert ctx1.current_positions.height == 0
+
+        # 注文の約定によりExchangeClient側のポジションが変化する
+        mock_exchange_client.fetch_positions.return_value = _SINGLE_POSITION_DF
+        ctx2 = store.load(dt2, mock_exchange_client)
+
+        assert ctx2 is not None
+        assert ctx2.current_positions is _SINGLE_POSITION_DF
+        assert mock_exchange_client.fetch_positions.call_count == 2
+
+    def test_in_memory_store_identical_resave_sees_new_positions(self, mock_exchange_client: MagicMock) -> None:
+        """同一DataFrameを同じ日時で再保存した後も、約定後の最新ポジションを取得する"""
+        store = InMemoryStore()
+
+        store.save_signals(_TARGET_DATETIME, _SIGNALS_DF)
+        mock_exchange_client.fetch_positions.return_value = _EMPTY_POSITIONS_DF
+        store.load_latest(mock_exchange_client)
+
+        # 約定後に同じシグナルを再保存する
+        mock_exchange_client.fetch_positions.return_value = _SINGLE_POSITION_DF
+        store.save_signals(_TARGET_DATETIME, _SIGNALS_DF)
+        ctx = store.load_latest(mock_exchange_client)
+
+        assert ctx is not None
+        assert ctx.signals is _SIGNALS_DF
+        assert ctx.current_positions is _SINGLE_POSITION_DF
+        assert mock_exchange_client.fetch_positions.call_count == 2
 
-        signals = pl.DataFrame({"datetime": [target_datetime], "symbol": ["AAPL"], "signal": [0.5]})
-        store.save_signals(target_datetime, signals)
+    def test_in_memory_store_defensive_clone(self, mock_exchange_client: MagicMock) -> None:
+        """defensive_clone=Trueの場合は複製を保持し、Falseの場合は参照を保持する"""
+        cloning_store = InMemoryStore(defensive_clone=True)
+        cloning_store.save_signals(_TARGET_DATETIME, _SIGNALS_DF)
+        cloned_ctx = cloning_store.load_latest(mock_exchange_client)
 
+        assert cloned_ctx is not None
+        assert cloned_ctx.signals is not _SIGNALS_DF
+        assert cloned_ctx.signals is not None
+        assert cloned_ctx.signals.equals(_SIGNALS_DF)
+
+        store = InMemoryStore()
+        store.save_signals(_TARGET_DATETIME, _SIGNALS_DF)
         ctx = store.load_latest(mock_exchange_client)
 
         assert ctx is not None
-        assert ctx.current_datetime == target_datetime
+        assert ctx.signals is _SIGNALS_DF
+
+    def test_in_memory_store_load_with_prebound_fetch_positions(self, mock_exchange_client: MagicMock) -> None:
+        """load_with()は束縛済みのfetch_positionsを呼び出しごとに実行し、最新のポジションを返す"""
+        store = InMemoryStore()
+        store.save_signals(_TARGET_DATETIME, _SIGNALS_DF)
+
+        positions_sequence = [_EMPTY_POSITIONS_DF, _SINGLE_POSITION_DF, _POSITIONS_DF]
+        mock_exchange_client.fetch_positions.side_effect = positions_sequence
+        fetch_positions = mock_exchange_client.fetch_positions
+        for expected in positions_sequence:
+            ctx = store.load_with(_TARGET_DATETIME, fetch_positions)
+            assert ctx is not None
+            assert ctx.current_positions is expected
+
+        assert fetch_positions.call_count == 3
 
     def test_in_memory_store_exists(self) -> None:
         """存在確認"""
-        from qeel.stores.in_memory import InMemoryStore
-
         store = InMemoryStore()
 
-        assert store.exists(datetime(2025, 1, 15)) is False
+        assert store.exists(_TARGET_DATETIME) is False
 
-        store.save_signals(
-            datetime(2025, 1, 15),
-            pl.DataFrame({"datetime": [datetime(2025, 1, 15)], "symbol": ["AAPL"], "signal": [0.5]}),
-        )
+        store.save_signals(_TARGET_DATETIME, _SIGNALS_DF)
 
-        assert store.exists(datetime(2025, 1, 15)) is True
+        assert store.exists(_TARGET_DATETIME) is True
@@ -6,15 +6,29 @@ data-model.mdとcontracts/base_data_source.mdを参照
 
 from datetime import datetime, timedelta
 from pathlib import Path
-from typing import TYPE_CHECKING
+from typing import Any
 
 import polars as pl
 import pytest
 
 from qeel.config import DataSourceConfig
+from qeel.data_sources.base import BaseDataSource
+from qeel.data_sources.mock import MockDataSource
 
-if TYPE_CHECKING:
-    from qeel.data_sources.base import BaseDataSource
+
+def _make_config(**overrides: Any) -> DataSourceConfig:
+    """テスト用DataSourceConfigを生成する（指定した項目のみデフォルトから上書き）"""
+    params: dict[str, Any] = {
+        "name": "test",
+        "datetime_column": "datetime",
+        "offset_seconds": 0,
+        "window_seconds": 86400,
+        "module": "qeel.data_sources.mock",
+        "class_name": "MockDataSource",
+        "source_path": "test.parquet",
+    }
+    params.update(overrides)
+    return DataSourceConfig(**params)
 
 
 class TestBaseDataSourceCannotInstantiate:
@@ -22,81 +36,56 @@ class TestBaseDataSourceCannotInstantiate:
 
     def test_base_data_source_cannot_instantiate(self) -> None:
         """ABCは直接インスタンス化不可"""
-        from qeel.data_sources.base import BaseDataSource
-
-        config = DataSourceConfig(
-            name="test",
-            datetime_column="datetime",
-            offset_seconds=0,
-            window_seconds=86400,
-            module="qeel.data_sources.mock",
-            class_name="MockDataSource",
-            source_path="test.parquet",
-        )
+        config = _make_config()
 
         with pytest.raises(TypeError):
             BaseDataSource(config=config)  # type: ignore[abstract]
 
 
+class _ConcreteDataSource(BaseDataSource):
+    """BaseDataSourceを継承した最小限の具象クラス"""
+
+    def __init__(
+        self,
+        config: DataSourceConfig,
+        mock_data: pl.DataFrame | None = None,
+    ) -> None:
+        super().__init__(config=config)
+        self._mock_data = mock_data
+
+    def fetch(self, start: datetime, end: datetime, symbols: list[str]) -> pl.DataFrame:
+        if self._mock_data is None:
+            return pl.DataFrame()
+        return self._mock_data
+
+
 class ConcreteDataSource:
     """テスト用の具象DataSourceスタブ
 
     ヘルパーメソッドをテストするために使用する。
+    具象クラスはモジュールレベルで一度だけ定義し、インスタンス生成ごとに再定義しない。
     """
 
     def __init__(self, config: DataSourceConfig, mock_data: pl.DataFrame | None = None) -> None:
-        from qeel.data_sources.base import BaseDataSource
-
-        # BaseDataSourceを継承した具象クラスを動的に作成
-        class _ConcreteDataSource(BaseDataSource):
-            def __init__(
-                self,
-                config: DataSourceConfig,
-                mock_data: pl.DataFrame | None = None,
-            ) -> None:
-                super().__init__(config=config)
-                self._mock_data = mock_data
-
-            def fetch(self, start: datetime, end: datetime, symbols: list[str]) -> pl.DataFrame:
-                if self._mock_data is None:
-                    return pl.DataFrame()
-                return self._mock_data
-
         self._instance = _ConcreteDataSource(config=config, mock_data=mock_data)
 
     @property
-    def instance(self) -> "BaseDataSource":
+    def instance(self) -> BaseDataSource:
         return self._instance
 
 
 class TestNormalizeDatetimeColumn:
     """_normalize_datetime_column()ヘルパーメソッドのテスト"""
 
-    @pytest.fixture
+    @pytest.fixture(scope="module")
     def config_with_different_datetime_column(self) -> DataSourceConfig:
         """datetime列名が"datetime"以外の設定"""
-        return DataSourceConfig(
-            name="test",
-            datetime_column="timestamp",
-            offset_seconds=0,
-            window_seconds=86400,
-            module="qeel.data_sources.mock",
-            class_name="MockDataSource",
-            source_path="test.parquet",
-        )
+        return _make_config(datetime_column="timestamp")
 
-    @pytest.fixture
+    @pytest.fixture(scope="module")
     def config_with_standard_datetime_column(self) -> DataSourceConfig:
         """datetime列名が"datetime"の設定"""
-        return DataSourceConfig(
-            name="test",
-            datetime_column="datetime",
-            offset_seconds=0,
-            window_seconds=86400,
-            module="qeel.data_sources.mock",
-            class_name="MockDataSource",
-            source_path="test.parquet",
-        )
+        return _make_config()
 
     def test_normalize_datetime_column_renames(self, config_with_different_datetime_column: DataSourceConfig) -> None:
         """datetime_columnが"datetime"以外の場合リネームされる"""
@@ -174,82 +163,31 @@ class TestNormalizeDatetimeColumn:
 class TestAdjustWindowForOffset:
     """_adjust_window_for_offset()ヘルパーメソッドのテスト"""
 
-    @pytest.fixture
+    @pytest.fixture(scope="module")
     def config_with_positive_offset(self) -> DataSourceConfig:
         """正のオフセット設定"""
-        return DataSourceConfig(
-            name="test",
-            datetime_column="datetime",
-            offset_seconds=3600,  # 1時間
-            window_seconds=86400,
-            module="qeel.data_sources.mock",
-            class_name="MockDataSource",
-            source_path="test.parquet",
-        )
-
-    @pytest.fixture
-    def config_with_zero_offset(self) -> DataSourceConfig:
-        """オフセット0の設定"""
-        return DataSourceConfig(
-            name="test",
-            datetime_column="datetime",
-            offset_seconds=0,
-            window_seconds=86400,
-            module="qeel.data_sources.mock",
-            class_name="MockDataSource",
-            source_path="test.parquet",
-        )
-
-    @pytest.fixture
-    def config_with_negative_offset(self) -> DataSourceConfig:
-        """負のオフセット設定"""
-        return DataSourceConfig(
-            name="test",
-            datetime_column="datetime",
-            offset_seconds=-3600,  # -1時間
-            window_seconds=86400,
-            module="qeel.data_sources.mock",
-            class_name="MockDataSource",
-            source_path="test.parquet",
-        )
-
-    def test_adjust_window_for_offset_positive(self, config_with_positive_offset: DataSourceConfig) -> None:
-        """正のoffset_secondsでwindowが過去方向に調整される"""
-        ds = ConcreteDataSource(config=config_with_positive_offset)
-
-        start = datetime(2023, 1, 1, 10, 0, 0)
-        end = datetime(2023, 1, 1, 11, 0, 0)
-
-        adjusted_start, adjusted_end = ds.instance._adjust_window_for_offset(start, end)
-
-        # 1時間オフセットなので1時間過去に調整される
-        assert adjusted_start == datetime(2023, 1, 1, 9, 0, 0)
-        assert adjusted_end == datetime(2023, 1, 1, 10, 0, 0)
-
-    def test_adjust_window_for_offset_zero(self, config_with_zero_offset: DataSourceConfig) -> None:
-        """offset_seconds=0の場合windowは変化なし"""
-        ds = ConcreteDataSource(config=config_with_zero_offset)
-
-        start = datetime(2023, 1, 1, 10, 0, 0)
-        end = datetime(2023, 1, 1, 11, 0, 0)
-
-        adjusted_start, adjusted_end = ds.instance._adjust_window_for_offset(start, end)
-
-        assert adjusted_start == start
-        assert adjusted_end == end
-
-    def test_adjust_window_for_offset_negative(self, config_with_negative_offset: DataSourceConfig) -> None:
-        """負のoffset_secondsでwindowが未来方向に調整される"""
-        ds = ConcreteDataSource(config=config_with_negative_offset)
+        return _make_config(offset_seconds=3600)  # 1時間
+
+    @pytest.mark.parametrize(
+        ("offset_seconds", "expected_shift"),
+        [
+            (3600, timedelta(hours=-1)),  # 正のoffset_secondsでwindowが過去方向に調整される
+            (0, timedelta(0)),  # offset_seconds=0の場合windowは変化なし
+            (-3600, timedelta(hours=1)),  # 負のoffset_secondsでwindowが未来方向に調整される
+        ],
+    )
+    def test_adjust_window_for_offset(self, offset_seconds: int, expected_shift: timedelta) -> None:
+        """offset_secondsの符号に応じてwindowの両端が同じだけ調整される"""
+        config = _make_config(offset_seconds=offset_seconds)
+        ds = ConcreteDataSource(config=config)
 
         start = datetime(2023, 1, 1, 10, 0, 0)
         end = datetime(2023, 1, 1, 11, 0, 0)
 
         adjusted_start, adjusted_end = ds.instance._adjust_window_for_offset(start, end)
 
-        # -1時間オフセットなので1時間未来に調整される
-        assert adjusted_start == datetime(2023, 1, 1, 11, 0, 0)
-        assert adjusted_end == datetime(2023, 1, 1, 12, 0, 0)
+        assert adjusted_start == start + expected_shift
+        assert adjusted_end == end + expected_shift
 
     def test_adjust_window_prevents_data_leak(self, config_with_positive_offset: DataSourceConfig) -> None:
         """offset_seconds適用後のwindowでフィルタリングした場合、未来データが含まれないことを確認"""
@@ -270,30 +208,20 @@ class TestAdjustWindowForOffset:
 class TestFilterByDatetimeAndSymbols:
     """_filter_by_datetime_and_symbols()ヘルパーメソッドのテスト"""
 
-    @pytest.fixture
+    @pytest.fixture(scope="module")
     def config(self) -> DataSourceConfig:
-        return DataSourceConfig(
-            name="test",
-            datetime_column="datetime",
-            offset_seconds=0,
-            window_seconds=86400,
-            module="qeel.data_sources.mock",
-            class_name="MockDataSource",
-            source_path="test.parquet",
-        )
+        return _make_config()
 
-    @pytest.fixture
-    def sample_dataframe(self) -> pl.DataFrame:
-        """テスト用サンプルDataFrame"""
+    @pytest.fixture(scope="module", params=[pl.Utf8, pl.Categorical], ids=["utf8", "categorical"])
+    def sample_dataframe(self, request: pytest.FixtureRequest) -> pl.DataFrame:
+        """テスト用サンプルDataFrame（symbol列がUtf8/Categoricalの両方で検証する）"""
         return pl.DataFrame(
             {
-                "datetime": [
-                    datetime(2023, 1, 1, 9, 0, 0),
-                    datetime(2023, 1, 1, 10, 0, 0),
-                    datetime(2023, 1, 1, 11, 0, 0),
-                    datetime(2023, 1, 1, 12, 0, 0),
-                ],
-                "symbol": ["AAPL", "GOOG", "AAPL", "MSFT"],
+                # 09:00〜12:00の1時間刻み（Pythonのdatetimeを経由せずDatetime("us")列を直接生成）
+                "datetime": pl.datetime_range(
+                    datetime(2023, 1, 1, 9, 0, 0), datetime(2023, 1, 1, 12, 0, 0), "1h", time_unit="us", eager=True
+                ),
+                "symbol": pl.Series(["AAPL", "GOOG", "AAPL", "MSFT"], dtype=request.param),
                 "close": [100.0, 200.0, 101.0, 300.0],
             }
         )
@@ -312,9 +240,9 @@ class TestFilterByDatetimeAndSymbols:
 
         # 10:00のAAPLとGOOG、11:00のAAPLのみ
         assert len(result) == 2
-        assert set(result["symbol"].to_list()) == {"AAPL", "GOOG"}
+        assert sorted(result["symbol"].unique().to_list()) == ["AAPL", "GOOG"]
         # 09:00のAAPLは範囲外、12:00のMSFTはsymbols外
-        assert datetime(2023, 1, 1, 9, 0, 0) not in result["datetime"].to_list()
+        assert not result["datetime"].is_in([datetime(2023, 1, 1, 9, 0, 0)]).any()
 
     def test_filter_by_datetime_and_symbols_empty_result(
         self, config: DataSourceConfig, sample_dataframe: pl.DataFrame
@@ -357,20 +285,12 @@ class TestMockDataSource:
     contracts/base_data_source.md参照。
     """
 
-    @pytest.fixture
+    @pytest.fixture(scope="module")
     def config(self) -> DataSourceConfig:
         """テスト用設定"""
-        return DataSourceConfig(
-            name="mock_ohlcv",
-            datetime_column="datetime",
-            offset_seconds=0,
-            window_seconds=86400,
-            module="qeel.data_sources.mock",
-            class_name="MockDataSource",
-            source_path="mock",
-        )
+        return _make_config(name="mock_ohlcv", source_path="mock")
 
-    @pytest.fixture
+    @pytest.fixture(scope="module")
     def mock_data(self) -> pl.DataFrame:
         """モックデータ"""
         return pl.DataFrame(
@@ -390,13 +310,14 @@ class TestMockDataSource:
             }
         )
 
-    def test_mock_data_source_returns_dataframe(self, config: DataSourceConfig, mock_data: pl.DataFrame) -> None:
-        """fetch()がPolars DataFrameを返す"""
-        from qeel.data_sources.mock import MockDataSource
-
-        ds = MockDataSource(config=config, data=mock_data)
+    @pytest.fixture(scope="module")
+    def mock_ds(self, config: DataSourceConfig, mock_data: pl.DataFrame) -> MockDataSource:
+        """mock_dataを保持するMockDataSource（fetchは状態を変更しないため共有する）"""
+        return MockDataSource(config=config, data=mock_data)
 
-        result = ds.fetch(
+    def test_mock_data_source_returns_dataframe(self, mock_ds: MockDataSource) -> None:
+        """fetch()がPolars DataFrameを返す"""
+        result = mock_ds.fetch(
             start=datetime(2023, 1, 1, 0, 0, 0),
             end=datetime(2023, 1, 2, 23, 59, 59),
             symbols=["AAPL", "GOOG", "MSFT"],
@@ -405,13 +326,9 @@ class TestMockDataSource:
         assert isinstance(result, pl.DataFrame)
         assert len(result) > 0
 
-    def test_mock_data_source_respects_symbols(self, config: DataSourceConfig, mock_data: pl.DataFrame) -> None:
+    def test_mock_data_source_respects_symbols(self, mock_ds: MockDataSource) -> None:
         """指定されたsymbolsのデータのみ返す"""
-        from qeel.data_sources.mock import MockDataSource
-
-        ds = MockDataSource(config=config, data=mock_data)
-
-        result = ds.fetch(
+        result = mock_ds.fetch(
             start=datetime(2023, 1, 1, 0, 0, 0),
             end=datetime(2023, 1, 2, 23, 59, 59),
             symbols=["AAPL"],
@@ -419,16 +336,12 @@ class TestMockDataSource:
 
         # AAPLのみ（2行）
         assert len(result) == 2
-        assert all(s == "AAPL" for s in result["symbol"].to_list())
+        assert (result["symbol"] == "AAPL").all()
 
-    def test_mock_data_source_respects_datetime_range(self, config: DataSourceConfig, mock_data: pl.DataFrame) -> None:
+    def test_mock_data_source_respects_datetime_range(self, mock_ds: MockDataSource) -> None:
         """指定されたdatetime範囲内のデータを返す"""
-        from qeel.data_sources.mock import MockDataSource
-
-        ds = MockDataSource(config=config, data=mock_data)
-
         # 1/1のみ
-        result = ds.fetch(
+        result = mock_ds.fetch(
             start=datetime(2023, 1, 1, 0, 0, 0),
             end=datetime(2023, 1, 1, 23, 59, 59),
             symbols=["AAPL", "GOOG", "MSFT"],
@@ -437,17 +350,11 @@ class TestMockDataSource:
         # 1/1のデータは3行（AAPL, GOOG, AAPL）
         assert len(result) == 3
         # MSFTは1/2なので含まれない
-        assert "MSFT" not in result["symbol"].to_list()
+        assert not (result["symbol"] == "MSFT").any()
 
-    def test_mock_data_source_returns_empty_when_no_match(
-        self, config: DataSourceConfig, mock_data: pl.DataFrame
-    ) -> None:
+    def test_mock_data_source_returns_empty_when_no_match(self, mock_ds: MockDataSource) -> None:
         """条件に一致するデータがない場合は空DataFrame"""
-        from qeel.data_sources.mock import MockDataSource
-
-        ds = MockDataSource(config=config, data=mock_data)
-
-        result = ds.fetch(
+        result = mock_ds.fetch(
             start=datetime(2023, 1, 3, 0, 0, 0),
             end=datetime(2023, 1, 3, 23, 59, 59),
             symbols=["AAPL"],
@@ -457,8 +364,6 @@ class TestMockDataSource:
 
     def test_mock_data_source_default_schema(self, config: DataSourceConfig) -> None:
         """デフォルトで最小OHLCVスキーマを持つ（datetime, symbol, open, high, low, close, volume）"""
-        from qeel.data_sources.mock import MockDataSource
-
         # データを渡さずに作成
         ds = MockDataSource(config=config)
 
@@ -487,20 +392,17 @@ class TestParquetDataSource:
     contracts/base_data_source.md参照。
     """
 
-    @pytest.fixture
+    @pytest.fixture(scope="module")
     def config(self) -> DataSourceConfig:
         """テスト用設定"""
-        return DataSourceConfig(
+        return _make_config(
             name="ohlcv",
-            datetime_column="datetime",
-            offset_seconds=0,
-            window_seconds=86400,
             module="qeel.data_sources.parquet",
             class_name="ParquetDataSource",
             source_path="ohlcv.parquet",
         )
 
-    @pytest.fixture
+    @pytest.fixture(scope="module")
     def sample_data(self) -> pl.DataFrame:
         """サンプルデータ"""
         return pl.DataFrame(
@@ -572,11 +474,9 @@ class TestParquetDataSource:
         from qeel.io.in_memory import InMemoryIO
 
         # datetime列を"timestamp"としてテスト
-        config = DataSourceConfig(
+        config = _make_config(
             name="ohlcv",
             datetime_column="timestamp",  # datetimeではない列名
-            offset_seconds=0,
-            window_seconds=86400,
             module="qeel.data_sources.parquet",
             class_name="ParquetDataSource",
             source_path="ohlcv.parquet",
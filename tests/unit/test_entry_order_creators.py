@@ -3,187 +3,229 @@
 TDDに従い、テストを先に作成する。
 """
 
+import re
 from abc import ABC
 from datetime import datetime
+from functools import lru_cache
 
 import polars as pl
+import pyarrow as pa
 import pytest
+from pydantic import ValidationError
 
 from qeel.config.params import EntryOrderCreatorParams
 from qeel.entry_order_creators.base import BaseEntryOrderCreator
-
-
-class TestBaseEntryOrderCreatorValidation:
-    """BaseEntryOrderCreatorのバリデーションテスト"""
-
-    def test_validate_inputs_success(self) -> None:
-        """正常な入力でバリデーションが成功する"""
-
-        class ConcreteCreator(BaseEntryOrderCreator):
-            def create(
-                self,
-                portfolio_plan: pl.DataFrame,
-                current_positions: pl.DataFrame,
-                ohlcv: pl.DataFrame,
-            ) -> pl.DataFrame:
-                self._validate_inputs(portfolio_plan, current_positions, ohlcv)
-                return pl.DataFrame(
-                    {
-                        "symbol": ["AAPL"],
-                        "side": ["buy"],
-                        "quantity": [100.0],
-                        "price": [None],
-                        "order_type": ["market"],
-                    }
-                )
-
-        params = EntryOrderCreatorParams()
-        creator = ConcreteCreator(params=params)
-
-        portfolio_plan = pl.DataFrame(
-            {
-                "datetime": [datetime(2024, 1, 1)],
-                "symbol": ["AAPL"],
-                "signal_strength": [1.5],
-            }
-        )
-        positions = pl.DataFrame(
-            {"symbol": ["AAPL"], "quantity": [100.0], "avg_price": [150.0]}
-        )
-        ohlcv = pl.DataFrame(
-            {
-                "datetime": [datetime(2024, 1, 1)],
-                "symbol": ["AAPL"],
-                "open": [150.0],
-                "high": [155.0],
-                "low": [148.0],
-                "close": [153.0],
-                "volume": [1000000],
-            }
-        )
-
-        # バリデーションが成功することを確認
-        result = creator.create(portfolio_plan, positions, ohlcv)
-        assert result.height == 1
-
-    def test_validate_inputs_invalid_portfolio_schema(self) -> None:
-        """ポートフォリオスキーマが不正な場合にValueErrorが発生する"""
-
-        class ConcreteCreator(BaseEntryOrderCreator):
-            def create(
-                self,
-                portfolio_plan: pl.DataFrame,
-                current_positions: pl.DataFrame,
-                ohlcv: pl.DataFrame,
-            ) -> pl.DataFrame:
-                self._validate_inputs(portfolio_plan, current_positions, ohlcv)
-                return pl.DataFrame()
-
-        params = EntryOrderCreatorParams()
-        creator = ConcreteCreator(params=params)
-
-        # datetime列が欠けている
-        portfolio_plan = pl.DataFrame(
-            {"symbol": ["AAPL"], "signal_strength": [1.5]}
-        )
-        positions = pl.DataFrame(
-            {"symbol": ["AAPL"], "quantity": [100.0], "avg_price": [150.0]}
-        )
-        ohlcv = pl.DataFrame(
+from qeel.entry_order_creators.equal_weight import (
+    EqualWeightEntryOrderCreator,
+    EqualWeightEntryParams,
+)
+
+_DT = datetime(2024, 1, 1)
+
+# エラーメッセージの検証用パターン（モジュール読み込み時に一度だけコンパイルする）
+_RE = {
+    "missing_column": re.compile("必須列が不足しています"),
+    "abstract": re.compile("abstract"),
+    "missing_ohlcv": re.compile("OHLCVデータが見つかりません"),
+}
+
+# 基底クラスのテストで共有するパラメータ（フィールドを持たず、テスト内で変更しない）
+_DEFAULT_BASE_PARAMS = EntryOrderCreatorParams()
+
+# 入力DataFrameのスキーマ（構築時に明示し、Pythonリストからの型推論を省く）
+_PORTFOLIO_SCHEMA = {
+    "datetime": pl.Datetime,
+    "symbol": pl.String,
+    "signal_strength": pl.Float64,
+}
+_POSITION_SCHEMA = {
+    "symbol": pl.String,
+    "quantity": pl.Float64,
+    "avg_price": pl.Float64,
+}
+_OHLCV_SCHEMA = {
+    "datetime": pl.Datetime,
+    "symbol": pl.String,
+    "open": pl.Float64,
+    "high": pl.Float64,
+    "low": pl.Float64,
+    "close": pl.Float64,
+    "volume": pl.Int64,
+}
+# OHLCVフィクスチャはArrowテーブルから取り込む（_OHLCV_SCHEMAと同じ列・型）
+_OHLCV_ARROW_SCHEMA = pa.schema(
+    [
+        ("datetime", pa.timestamp("us")),
+        ("symbol", pa.string()),
+        ("open", pa.float64()),
+        ("high", pa.float64()),
+        ("low", pa.float64()),
+        ("close", pa.float64()),
+        ("volume", pa.int64()),
+    ]
+)
+
+# スキーマのみの0行DataFrame（読み取り専用で共有する）
+# _validate_inputs()は列と型のみを検証するため、バリデーションテストには行データが不要
+_EMPTY_PORTFOLIO_PLAN = pl.DataFrame(schema=_PORTFOLIO_SCHEMA)
+_EMPTY_POSITIONS = pl.DataFrame(schema=_POSITION_SCHEMA)
+_EMPTY_OHLCV = pl.DataFrame(schema=_OHLCV_SCHEMA)
+
+
+class _ValidateOnlyCreator(BaseEntryOrderCreator):
+    """入力バリデーションのみを行うテスト用実装"""
+
+    def create(
+        self,
+        portfolio_plan: pl.DataFrame,
+        current_positions: pl.DataFrame,
+        ohlcv: pl.DataFrame,
+    ) -> pl.DataFrame:
+        self._validate_inputs(portfolio_plan, current_positions, ohlcv)
+        return pl.DataFrame()
+
+
+class _ConcreteCreator(BaseEntryOrderCreator):
+    """入力をバリデーションし、固定の買い注文を1件返すテスト用実装"""
+
+    def create(
+        self,
+        portfolio_plan: pl.DataFrame,
+        current_positions: pl.DataFrame,
+        ohlcv: pl.DataFrame,
+    ) -> pl.DataFrame:
+        self._validate_inputs(portfolio_plan, current_positions, ohlcv)
+        return pl.DataFrame(
             {
-                "datetime": [datetime(2024, 1, 1)],
                 "symbol": ["AAPL"],
-                "open": [150.0],
-                "high": [155.0],
-                "low": [148.0],
-                "close": [153.0],
-                "volume": [1000000],
+                "side": ["buy"],
+                "quantity": [100.0],
+                "price": [None],
+                "order_type": ["market"],
             }
         )
 
-        with pytest.raises(ValueError, match="必須列が不足しています"):
-            creator.create(portfolio_plan, positions, ohlcv)
-
-    def test_validate_inputs_invalid_position_schema(self) -> None:
-        """ポジションスキーマが不正な場合にValueErrorが発生する"""
-
-        class ConcreteCreator(BaseEntryOrderCreator):
-            def create(
-                self,
-                portfolio_plan: pl.DataFrame,
-                current_positions: pl.DataFrame,
-                ohlcv: pl.DataFrame,
-            ) -> pl.DataFrame:
-                self._validate_inputs(portfolio_plan, current_positions, ohlcv)
-                return pl.DataFrame()
 
-        params = EntryOrderCreatorParams()
-        creator = ConcreteCreator(params=params)
-
-        portfolio_plan = pl.DataFrame(
-            {
-                "datetime": [datetime(2024, 1, 1)],
-                "symbol": ["AAPL"],
-                "signal_strength": [1.5],
-            }
-        )
-        # quantity列が欠けている
-        positions = pl.DataFrame({"symbol": ["AAPL"], "avg_price": [150.0]})
-        ohlcv = pl.DataFrame(
-            {
-                "datetime": [datetime(2024, 1, 1)],
-                "symbol": ["AAPL"],
-                "open": [150.0],
-                "high": [155.0],
-                "low": [148.0],
-                "close": [153.0],
-                "volume": [1000000],
-            }
-        )
+@lru_cache(maxsize=None)
+def _portfolio_plan(symbols: tuple[str, ...], signals: tuple[float, ...]) -> pl.DataFrame:
+    """_DT時点のポートフォリオ計画を構築する
+
+    同じ引数での呼び出しはキャッシュ済みのDataFrameを返す（テスト内で変更しないこと）。
+
+    Args:
+        symbols: 銘柄コード
+        signals: symbolsと同じ順序のシグナル強度
+
+    Returns:
+        PortfolioSchema準拠のDataFrame
+    """
+    return pl.DataFrame(
+        {
+            "datetime": [_DT] * len(symbols),
+            "symbol": list(symbols),
+            "signal_strength": list(signals),
+        },
+        schema=_PORTFOLIO_SCHEMA,
+    )
+
+
+@pytest.fixture(scope="session")
+def aapl_positions() -> pl.DataFrame:
+    """AAPLを100株保有しているポジション"""
+    return pl.DataFrame(
+        {"symbol": ["AAPL"], "quantity": [100.0], "avg_price": [150.0]},
+        schema=_POSITION_SCHEMA,
+    )
+
+
+def _ohlcv_from_arrow(table: pa.Table) -> pl.DataFrame:
+    """型付きのArrowテーブルをそのままOHLCVのDataFrameとして取り込む"""
+    df = pl.from_arrow(table)
+    assert isinstance(df, pl.DataFrame)
+    return df
+
+
+@pytest.fixture(scope="session")
+def aapl_ohlcv() -> pl.DataFrame:
+    """AAPL1銘柄のOHLCV"""
+    table = pa.table(
+        {
+            "datetime": [_DT],
+            "symbol": ["AAPL"],
+            "open": [150.0],
+            "high": [155.0],
+            "low": [148.0],
+            "close": [153.0],
+            "volume": [1000000],
+        },
+        schema=_OHLCV_ARROW_SCHEMA,
+    )
+    return _ohlcv_from_arrow(table)
+
+
+@pytest.fixture(scope="session")
+def two_symbol_ohlcv() -> pl.DataFrame:
+    """AAPL/GOOG2銘柄のOHLCV"""
+    table = pa.table(
+        {
+            "datetime": [_DT] * 2,
+            "symbol": ["AAPL", "GOOG"],
+            "open": [150.0, 100.0],
+            "high": [155.0, 105.0],
+            "low": [148.0, 98.0],
+            "close": [153.0, 102.0],
+            "volume": [1000000, 2000000],
+        },
+        schema=_OHLCV_ARROW_SCHEMA,
+    )
+    return _ohlcv_from_arrow(table)
+
+
+@pytest.fixture(scope="module")
+def equal_weight_creator() -> EqualWeightEntryOrderCreator:
+    """リバランス閾値0の等ウェイト注文生成器（状態を持たないためモジュールで共有する）"""
+    params = EqualWeightEntryParams(capital=1_000_000.0, rebalance_threshold=0.0)
+    return EqualWeightEntryOrderCreator(params=params)
 
-        with pytest.raises(ValueError, match="必須列が不足しています"):
-            creator.create(portfolio_plan, positions, ohlcv)
 
-    def test_validate_inputs_invalid_ohlcv_schema(self) -> None:
-        """OHLCVスキーマが不正な場合にValueErrorが発生する"""
+class TestBaseEntryOrderCreatorValidation:
+    """BaseEntryOrderCreatorのバリデーションテスト"""
 
-        class ConcreteCreator(BaseEntryOrderCreator):
-            def create(
-                self,
-                portfolio_plan: pl.DataFrame,
-                current_positions: pl.DataFrame,
-                ohlcv: pl.DataFrame,
-            ) -> pl.DataFrame:
-                self._validate_inputs(portfolio_plan, current_positions, ohlcv)
-                return pl.DataFrame()
+    def test_validate_inputs_success(
+        self,
+        aapl_positions: pl.DataFrame,
+        aapl_ohlcv: pl.DataFrame,
+    ) -> None:
+        """正常な入力でバリデーションが成功する"""
+        creator = _ConcreteCreator(params=_DEFAULT_BASE_PARAMS)
 
-        params = EntryOrderCreatorParams()
-        creator = ConcreteCreator(params=params)
+        portfolio_plan = _portfolio_plan(("AAPL",), (1.5,))
 
-        portfolio_plan = pl.DataFrame(
-            {
-                "datetime": [datetime(2024, 1, 1)],
-                "symbol": ["AAPL"],
-                "signal_strength": [1.5],
-            }
-        )
-        positions = pl.DataFrame(
-            {"symbol": ["AAPL"], "quantity": [100.0], "avg_price": [150.0]}
-        )
-        # open列が欠けている
-        ohlcv = pl.DataFrame(
-            {
-                "datetime": [datetime(2024, 1, 1)],
-                "symbol": ["AAPL"],
-                "high": [155.0],
-                "low": [148.0],
-                "close": [153.0],
-                "volume": [1000000],
-            }
-        )
+        # バリデーションが成功することを確認
+        result = creator.create(portfolio_plan, aapl_positions, aapl_ohlcv)
+        assert result.height == 1
 
-        with pytest.raises(ValueError, match="必須列が不足しています"):
-            creator.create(portfolio_plan, positions, ohlcv)
+    @pytest.mark.parametrize(
+        ("drop_from", "drop_col"),
+        [("portfolio_plan", "datetime"), ("positions", "quantity"), ("ohlcv", "open")],
+        ids=["portfolio", "position", "ohlcv"],
+    )
+    def test_validate_inputs_invalid_schema(
+        self,
+        drop_from: str,
+        drop_col: str,
+    ) -> None:
+        """いずれかの入力の必須列が欠けている場合にValueErrorが発生する"""
+        creator = _ValidateOnlyCreator(params=_DEFAULT_BASE_PARAMS)
+        frames = {
+            "portfolio_plan": _EMPTY_PORTFOLIO_PLAN,
+            "positions": _EMPTY_POSITIONS,
+            "ohlcv": _EMPTY_OHLCV,
+        }
+        frames[drop_from] = frames[drop_from].drop(drop_col)
+
+        with pytest.raises(ValueError, match=_RE["missing_column"]):
+            creator.create(frames["portfolio_plan"], frames["positions"], frames["ohlcv"])
 
 
 class TestBaseEntryOrderCreatorABC:
@@ -195,8 +237,8 @@ class TestBaseEntryOrderCreatorABC:
 
     def test_cannot_instantiate_directly(self) -> None:
         """BaseEntryOrderCreatorは直接インスタンス化できない"""
-        with pytest.raises(TypeError, match="abstract"):
-            BaseEntryOrderCreator(params=EntryOrderCreatorParams())  # type: ignore
+        with pytest.raises(TypeError, match=_RE["abstract"]):
+            BaseEntryOrderCreator(params=_DEFAULT_BASE_PARAMS)  # type: ignore
 
     def test_must_implement_create(self) -> None:
         """createメソッドの実装が必要"""
@@ -205,92 +247,48 @@ class TestBaseEntryOrderCreatorABC:
         class IncompleteCreator(BaseEntryOrderCreator):
             pass
 
-        with pytest.raises(TypeError, match="abstract"):
-            IncompleteCreator(params=EntryOrderCreatorParams())  # type: ignore
+        with pytest.raises(TypeError, match=_RE["abstract"]):
+            IncompleteCreator(params=_DEFAULT_BASE_PARAMS)  # type: ignore
 
     def test_subclass_with_create_works(self) -> None:
         """createメソッドを実装したサブクラスはインスタンス化できる"""
-
-        class CompleteCreator(BaseEntryOrderCreator):
-            def create(
-                self,
-                portfolio_plan: pl.DataFrame,
-                current_positions: pl.DataFrame,
-                ohlcv: pl.DataFrame,
-            ) -> pl.DataFrame:
-                return pl.DataFrame(
-                    {
-                        "symbol": ["TEST"],
-                        "side": ["buy"],
-                        "quantity": [100.0],
-                        "price": [None],
-                        "order_type": ["market"],
-                    }
-                )
-
-        params = EntryOrderCreatorParams()
-        creator = CompleteCreator(params=params)
-        assert creator.params == params
+        creator = _ConcreteCreator(params=_DEFAULT_BASE_PARAMS)
+        assert creator.params == _DEFAULT_BASE_PARAMS
 
 
 class TestEqualWeightEntryOrderCreator:
     """EqualWeightEntryOrderCreatorのテスト"""
 
-    def test_default_params(self) -> None:
-        """デフォルトパラメータの確認"""
-        from qeel.entry_order_creators.equal_weight import EqualWeightEntryParams
-
-        params = EqualWeightEntryParams()
-        assert params.capital == 1_000_000.0
-        assert params.rebalance_threshold == 0.05
-
-    def test_custom_params(self) -> None:
-        """カスタムパラメータの確認"""
-        from qeel.entry_order_creators.equal_weight import EqualWeightEntryParams
-
-        params = EqualWeightEntryParams(capital=500_000.0, rebalance_threshold=0.1)
-        assert params.capital == 500_000.0
-        assert params.rebalance_threshold == 0.1
-
-    def test_equal_weight_order_generation(self) -> None:
+    @pytest.mark.parametrize(
+        ("kwargs", "expected_capital", "expected_threshold"),
+        [
+            ({}, 1_000_000.0, 0.05),
+            ({"capital": 500_000.0, "rebalance_threshold": 0.1}, 500_000.0, 0.1),
+        ],
+        ids=["default", "custom"],
+    )
+    def test_params(
+        self,
+        kwargs: dict[str, float],
+        expected_capital: float,
+        expected_threshold: float,
+    ) -> None:
+        """デフォルト・カスタムパラメータの確認"""
+        params = EqualWeightEntryParams(**kwargs)
+        assert params.capital == expected_capital
+        assert params.rebalance_threshold == expected_threshold
+
+    @pytest.mark.slow
+    def test_equal_weight_order_generation(
+        self,
+        two_symbol_ohlcv: pl.DataFrame,
+        equal_weight_creator: EqualWeightEntryOrderCreator,
+    ) -> None:
         """等ウェイトで注文が生成される"""
-        from qeel.entry_order_creators.equal_weight import (
-            EqualWeightEntryOrderCreator,
-            EqualWeightEntryParams,
-        )
+        portfolio_plan = _portfolio_plan(("AAPL", "GOOG"), (1.5, 2.0))
 
-        params = EqualWeightEntryParams(capital=1_000_000.0, rebalance_threshold=0.0)
-        creator = EqualWeightEntryOrderCreator(params=params)
-
-        portfolio_plan = pl.DataFrame(
-            {
-                "datetime": [datetime(2024, 1, 1)] * 2,
-                "symbol": ["AAPL", "GOOG"],
-                "signal_strength": [1.5, 2.0],
-            }
-        )
         # ポジションなし
-        positions = pl.DataFrame(
-            {"symbol": [], "quantity": [], "avg_price": []},
-            schema={
-                "symbol": pl.String,
-                "quantity": pl.Float64,
-                "avg_price": pl.Float64,
-            },
-        )
-        ohlcv = pl.DataFrame(
-            {
-                "datetime": [datetime(2024, 1, 1)] * 2,
-                "symbol": ["AAPL", "GOOG"],
-                "open": [150.0, 100.0],
-                "high": [155.0, 105.0],
-                "low": [148.0, 98.0],
-                "close": [153.0, 102.0],
-                "volume": [1000000, 2000000],
-            }
-        )
-
-        result = creator.create(portfolio_plan, positions, ohlcv)
+        result = equal_weight_creator.create(portfolio_plan, _EMPTY_POSITIONS, two_symbol_ohlcv)
 
         assert result.height == 2
         assert "symbol" in result.columns
@@ -299,252 +297,93 @@ class TestEqualWeightEntryOrderCreator:
         assert "order_type" in result.columns
 
         # すべて買い注文
-        assert set(result["side"].to_list()) == {"buy"}
+        assert (result["side"] == "buy").all()
         # すべて成行注文
-        assert set(result["order_type"].to_list()) == {"market"}
+        assert (result["order_type"] == "market").all()
 
-    def test_market_order_price_is_null(self) -> None:
+    def test_market_order_price_is_null(
+        self,
+        aapl_ohlcv: pl.DataFrame,
+        equal_weight_creator: EqualWeightEntryOrderCreator,
+    ) -> None:
         """成行注文のpriceはNone"""
-        from qeel.entry_order_creators.equal_weight import (
-            EqualWeightEntryOrderCreator,
-            EqualWeightEntryParams,
-        )
+        portfolio_plan = _portfolio_plan(("AAPL",), (1.5,))
 
-        params = EqualWeightEntryParams(capital=1_000_000.0, rebalance_threshold=0.0)
-        creator = EqualWeightEntryOrderCreator(params=params)
-
-        portfolio_plan = pl.DataFrame(
-            {
-                "datetime": [datetime(2024, 1, 1)],
-                "symbol": ["AAPL"],
-                "signal_strength": [1.5],
-            }
-        )
-        positions = pl.DataFrame(
-            {"symbol": [], "quantity": [], "avg_price": []},
-            schema={
-                "symbol": pl.String,
-                "quantity": pl.Float64,
-                "avg_price": pl.Float64,
-            },
-        )
-        ohlcv = pl.DataFrame(
-            {
-                "datetime": [datetime(2024, 1, 1)],
-                "symbol": ["AAPL"],
-                "open": [150.0],
-                "high": [155.0],
-                "low": [148.0],
-                "close": [153.0],
-                "volume": [1000000],
-            }
-        )
-
-        result = creator.create(portfolio_plan, positions, ohlcv)
+        result = equal_weight_creator.create(portfolio_plan, _EMPTY_POSITIONS, aapl_ohlcv)
 
         assert result["price"].null_count() == 1
 
-    def test_negative_signal_generates_sell_order(self) -> None:
+    def test_negative_signal_generates_sell_order(
+        self,
+        two_symbol_ohlcv: pl.DataFrame,
+        equal_weight_creator: EqualWeightEntryOrderCreator,
+    ) -> None:
         """負のシグナルは売り注文を生成する"""
-        from qeel.entry_order_creators.equal_weight import (
-            EqualWeightEntryOrderCreator,
-            EqualWeightEntryParams,
-        )
-
-        params = EqualWeightEntryParams(capital=1_000_000.0, rebalance_threshold=0.0)
-        creator = EqualWeightEntryOrderCreator(params=params)
-
-        portfolio_plan = pl.DataFrame(
-            {
-                "datetime": [datetime(2024, 1, 1)] * 2,
-                "symbol": ["AAPL", "GOOG"],
-                "signal_strength": [1.5, -2.0],  # GOOGは負のシグナル
-            }
-        )
-        positions = pl.DataFrame(
-            {"symbol": [], "quantity": [], "avg_price": []},
-            schema={
-                "symbol": pl.String,
-                "quantity": pl.Float64,
-                "avg_price": pl.Float64,
-            },
-        )
-        ohlcv = pl.DataFrame(
-            {
-                "datetime": [datetime(2024, 1, 1)] * 2,
-                "symbol": ["AAPL", "GOOG"],
-                "open": [150.0, 100.0],
-                "high": [155.0, 105.0],
-                "low": [148.0, 98.0],
-                "close": [153.0, 102.0],
-                "volume": [1000000, 2000000],
-            }
-        )
+        # GOOGは負のシグナル
+        portfolio_plan = _portfolio_plan(("AAPL", "GOOG"), (1.5, -2.0))
 
-        result = creator.create(portfolio_plan, positions, ohlcv)
+        result = equal_weight_creator.create(portfolio_plan, _EMPTY_POSITIONS, two_symbol_ohlcv)
 
-        aapl_order = result.filter(pl.col("symbol") == "AAPL")
-        goog_order = result.filter(pl.col("symbol") == "GOOG")
+        sides = dict(zip(result["symbol"], result["side"]))
 
-        assert aapl_order["side"][0] == "buy"
-        assert goog_order["side"][0] == "sell"
+        assert sides["AAPL"] == "buy"
+        assert sides["GOOG"] == "sell"
 
     def test_empty_portfolio_returns_empty_dataframe(self) -> None:
         """空のポートフォリオに対して空のDataFrameを返す"""
-        from qeel.entry_order_creators.equal_weight import (
-            EqualWeightEntryOrderCreator,
-            EqualWeightEntryParams,
-        )
-
         params = EqualWeightEntryParams(capital=1_000_000.0)
         creator = EqualWeightEntryOrderCreator(params=params)
 
-        portfolio_plan = pl.DataFrame(
-            {"datetime": [], "symbol": [], "signal_strength": []},
-            schema={
-                "datetime": pl.Datetime,
-                "symbol": pl.String,
-                "signal_strength": pl.Float64,
-            },
-        )
-        positions = pl.DataFrame(
-            {"symbol": [], "quantity": [], "avg_price": []},
-            schema={
-                "symbol": pl.String,
-                "quantity": pl.Float64,
-                "avg_price": pl.Float64,
-            },
-        )
-        ohlcv = pl.DataFrame(
-            {
-                "datetime": [],
-                "symbol": [],
-                "open": [],
-                "high": [],
-                "low": [],
-                "close": [],
-                "volume": [],
-            },
-            schema={
-                "datetime": pl.Datetime,
-                "symbol": pl.String,
-                "open": pl.Float64,
-                "high": pl.Float64,
-                "low": pl.Float64,
-                "close": pl.Float64,
-                "volume": pl.Int64,
-            },
-        )
-
-        result = creator.create(portfolio_plan, positions, ohlcv)
+        result = creator.create(_EMPTY_PORTFOLIO_PLAN, _EMPTY_POSITIONS, _EMPTY_OHLCV)
 
         assert result.height == 0
 
-    def test_symbol_without_price_data_raises_error(self) -> None:
+    @pytest.mark.slow
+    def test_symbol_without_price_data_raises_error(
+        self,
+        aapl_ohlcv: pl.DataFrame,
+        equal_weight_creator: EqualWeightEntryOrderCreator,
+    ) -> None:
         """価格データがない銘柄があるとValueErrorが発生する"""
-        import pytest
+        portfolio_plan = _portfolio_plan(("AAPL", "GOOG"), (1.5, 2.0))
 
-        from qeel.entry_order_creators.equal_weight import (
-            EqualWeightEntryOrderCreator,
-            EqualWeightEntryParams,
-        )
-
-        params = EqualWeightEntryParams(capital=1_000_000.0, rebalance_threshold=0.0)
-        creator = EqualWeightEntryOrderCreator(params=params)
-
-        portfolio_plan = pl.DataFrame(
-            {
-                "datetime": [datetime(2024, 1, 1)] * 2,
-                "symbol": ["AAPL", "GOOG"],
-                "signal_strength": [1.5, 2.0],
-            }
-        )
-        positions = pl.DataFrame(
-            {"symbol": [], "quantity": [], "avg_price": []},
-            schema={
-                "symbol": pl.String,
-                "quantity": pl.Float64,
-                "avg_price": pl.Float64,
-            },
-        )
         # AAPLの価格データのみ（GOOGがない）
-        ohlcv = pl.DataFrame(
-            {
-                "datetime": [datetime(2024, 1, 1)],
-                "symbol": ["AAPL"],
-                "open": [150.0],
-                "high": [155.0],
-                "low": [148.0],
-                "close": [153.0],
-                "volume": [1000000],
-            }
-        )
-
-        with pytest.raises(ValueError, match="OHLCVデータが見つかりません"):
-            creator.create(portfolio_plan, positions, ohlcv)
+        with pytest.raises(ValueError, match=_RE["missing_ohlcv"]):
+            equal_weight_creator.create(portfolio_plan, _EMPTY_POSITIONS, aapl_ohlcv)
 
-    def test_rebalance_threshold_skips_small_changes(self) -> None:
+    @pytest.mark.slow
+    def test_rebalance_threshold_skips_small_changes(self, aapl_ohlcv: pl.DataFrame) -> None:
         """リバランス閾値以下の変動ではスキップされる"""
-        from qeel.entry_order_creators.equal_weight import (
-            EqualWeightEntryOrderCreator,
-            EqualWeightEntryParams,
-        )
-
         # リバランス閾値を50%に設定
         params = EqualWeightEntryParams(capital=1_000_000.0, rebalance_threshold=0.5)
         creator = EqualWeightEntryOrderCreator(params=params)
 
-        portfolio_plan = pl.DataFrame(
-            {
-                "datetime": [datetime(2024, 1, 1)],
-                "symbol": ["AAPL"],
-                "signal_strength": [1.5],
-            }
-        )
+        portfolio_plan = _portfolio_plan(("AAPL",), (1.5,))
         # 既にほぼ目標ウェイトで保有している
         # 目標: 1,000,000 * 1.0 / 150 = 6666.67株
         # 現在: 6000株 * 150 = 900,000 = 90%ウェイト
         # 目標との差: |100% - 90%| = 10% < 50%閾値 → スキップ
         positions = pl.DataFrame(
-            {"symbol": ["AAPL"], "quantity": [6000.0], "avg_price": [150.0]}
-        )
-        ohlcv = pl.DataFrame(
-            {
-                "datetime": [datetime(2024, 1, 1)],
-                "symbol": ["AAPL"],
-                "open": [150.0],
-                "high": [155.0],
-                "low": [148.0],
-                "close": [153.0],
-                "volume": [1000000],
-            }
+            {"symbol": ["AAPL"], "quantity": [6000.0], "avg_price": [150.0]},
+            schema=_POSITION_SCHEMA,
         )
 
-        result = creator.create(portfolio_plan, positions, ohlcv)
+        result = creator.create(portfolio_plan, positions, aapl_ohlcv)
 
         # 閾値を超えていないのでスキップ
         assert result.height == 0
 
-    def test_capital_param_validation(self) -> None:
-        """capitalパラメータは正の値でなければならない"""
-        from pydantic import ValidationError
-
-        from qeel.entry_order_creators.equal_weight import EqualWeightEntryParams
-
-        with pytest.raises(ValidationError):
-            EqualWeightEntryParams(capital=0.0)
-
-        with pytest.raises(ValidationError):
-            EqualWeightEntryParams(capital=-1000.0)
-
-    def test_rebalance_threshold_param_validation(self) -> None:
-        """rebalance_thresholdパラメータは0-1の範囲でなければならない"""
-        from pydantic import ValidationError
-
-        from qeel.entry_order_creators.equal_weight import EqualWeightEntryParams
-
-        with pytest.raises(ValidationError):
-            EqualWeightEntryParams(rebalance_threshold=-0.1)
-
+    @pytest.mark.parametrize(
+        "kwargs",
+        [
+            {"capital": 0.0},
+            {"capital": -1000.0},
+            {"rebalance_threshold": -0.1},
+            {"rebalance_threshold": 1.5},
+        ],
+        ids=["capital_zero", "capital_negative", "threshold_negative", "threshold_over_one"],
+    )
+    def test_invalid_param_validation(self, kwargs: dict[str, float]) -> None:
+        """capitalは正の値、rebalance_thresholdは0-1の範囲でなければならない"""
         with pytest.raises(ValidationError):
-            EqualWeightEntryParams(rebalance_threshold=1.5)
+            EqualWeightEntryParams(**kwargs)
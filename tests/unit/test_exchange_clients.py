@@ -677,6 +677,52 @@ class TestMockExchangeClientSubmitOrders:
         with pytest.raises(ValueError, match="指値注文にはpriceが必須"):
             client.submit_orders(orders)
 
+    def test_submit_orders_batch_dispatches_by_datetime(
+        self, cost_config: CostConfig, mock_data_source: MagicMock
+    ) -> None:
+        """datetime列ごとに日時昇順で注文が執行される"""
+        from qeel.exchange_clients.mock import MockExchangeClient
+
+        client = MockExchangeClient(cost_config, mock_data_source)
+        client.load_ohlcv(datetime(2024, 1, 1), datetime(2024, 1, 5), ["AAPL"])
+
+        orders = pl.DataFrame(
+            {
+                "datetime": [datetime(2024, 1, 2, 9, 0), datetime(2024, 1, 1, 9, 0)],
+                "symbol": ["AAPL", "AAPL"],
+                "side": ["sell", "buy"],
+                "quantity": [3.0, 10.0],
+                "price": [None, None],
+                "order_type": ["market", "market"],
+            }
+        )
+
+        client.submit_orders_batch(orders)
+
+        assert client.current_datetime == datetime(2024, 1, 2, 9, 0)
+        assert len(client.fill_history) == 2
+        # 1/1の買いは翌バー(1/2)、1/2の売りは翌バー(1/3)で約定
+        assert client.fill_history[0]["side"][0] == "buy"
+        assert client.fill_history[1]["side"][0] == "sell"
+
+    def test_submit_orders_batch_requires_datetime(self, cost_config: CostConfig, mock_data_source: MagicMock) -> None:
+        """datetime列がない場合ValueError"""
+        from qeel.exchange_clients.mock import MockExchangeClient
+
+        client = MockExchangeClient(cost_config, mock_data_source)
+        orders = pl.DataFrame(
+            {
+                "symbol": ["AAPL"],
+                "side": ["buy"],
+                "quantity": [10.0],
+                "price": [None],
+                "order_type": ["market"],
+            }
+        )
+
+        with pytest.raises(ValueError, match="datetime列が必須"):
+            client.submit_orders_batch(orders)
+
 
 class TestMockExchangeClientFetchFills:
     """MockExchangeClient fetch_fillsのテスト"""
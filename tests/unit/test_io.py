@@ -342,6 +342,22 @@ class TestLocalIO:
         assert loaded.shape[0] == 4
         assert loaded.shape[1] == 2
 
+    def test_local_io_scan_parquet(self, tmp_path: Path) -> None:
+        """scan_parquetはLazyFrameを返し、ファイルが存在しない場合はNone"""
+        from qeel.io.local import LocalIO
+
+        df = pl.DataFrame({"col1": [1, 2], "col2": ["a", "b"]})
+        df.write_parquet(tmp_path / "file.parquet")
+
+        with patch("qeel.io.local.get_workspace", return_value=tmp_path):
+            io = LocalIO()
+            scanned = io.scan_parquet(str(tmp_path / "file.parquet"))
+            missing = io.scan_parquet(str(tmp_path / "missing.parquet"))
+
+        assert isinstance(scanned, pl.LazyFrame)
+        assert scanned.collect().equals(df)
+        assert missing is None
+
 
 class TestS3IO:
     """S3IOのテスト（motoでAWS APIをモック）"""
@@ -547,6 +563,32 @@ class TestS3IO:
         assert len(files) == 2
         assert all("signals_" in f for f in files)
 
+    def test_s3_io_list_files_across_partitions(
+        self, mock_s3: Any, s3_bucket: str, s3_region: str, strategy_name: str
+    ) -> None:
+        """複数パーティション配下のオブジェクトを全て取得し、ソートして返す"""
+        from qeel.io.s3 import S3IO
+
+        prefix = "partitioned/"
+        keys = [
+            f"{prefix}2025/02/signals_2025-02-01.parquet",
+            f"{prefix}2024/12/signals_2024-12-31.parquet",
+            f"{prefix}2025/01/signals_2025-01-15.parquet",
+            f"{prefix}2025/01/portfolio_plan_2025-01-15.parquet",
+            f"{prefix}root.json",
+        ]
+        for key in keys:
+            mock_s3.put_object(Bucket=s3_bucket, Key=key, Body=b"1")
+
+        io = S3IO(bucket=s3_bucket, region=s3_region, strategy_name=strategy_name)
+
+        assert io.list_files(prefix) == sorted(keys)
+        assert io.list_files(prefix, pattern="signals_*.parquet") == [
+            f"{prefix}2024/12/signals_2024-12-31.parquet",
+            f"{prefix}2025/01/signals_2025-01-15.parquet",
+            f"{prefix}2025/02/signals_2025-02-01.parquet",
+        ]
+
     def test_s3_io_storage_options_initialized(
         self, mock_s3: Any, s3_bucket: str, s3_region: str, strategy_name: str
     ) -> None:
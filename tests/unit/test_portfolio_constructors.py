@@ -12,6 +12,9 @@ import pytest
 from qeel.config.params import PortfolioConstructorParams
 from qeel.portfolio_constructors.base import BasePortfolioConstructor
 
+# 空ポジション（スキーマのみ）。各テストで変更せず同一オブジェクトを共有する
+_EMPTY_POSITIONS = pl.DataFrame(schema={"symbol": pl.String, "quantity": pl.Float64, "avg_price": pl.Float64})
+
 
 class TestBasePortfolioConstructorValidation:
     """BasePortfolioConstructorのバリデーションテスト"""
@@ -246,10 +249,7 @@ class TestTopNPortfolioConstructor:
                 "signal": [1.0, 3.0, 2.0, 5.0, 4.0],
             }
         )
-        positions = pl.DataFrame(
-            {"symbol": [], "quantity": [], "avg_price": []},
-            schema={"symbol": pl.String, "quantity": pl.Float64, "avg_price": pl.Float64},
-        )
+        positions = _EMPTY_POSITIONS
 
         result = constructor.construct(signals, positions)
 
@@ -273,10 +273,7 @@ class TestTopNPortfolioConstructor:
                 "signal": [1.0, 3.0, 2.0, 5.0, 4.0],
             }
         )
-        positions = pl.DataFrame(
-            {"symbol": [], "quantity": [], "avg_price": []},
-            schema={"symbol": pl.String, "quantity": pl.Float64, "avg_price": pl.Float64},
-        )
+        positions = _EMPTY_POSITIONS
 
         result = constructor.construct(signals, positions)
 
@@ -300,10 +297,7 @@ class TestTopNPortfolioConstructor:
                 "signal": [1.0, 3.0, 2.0],
             }
         )
-        positions = pl.DataFrame(
-            {"symbol": [], "quantity": [], "avg_price": []},
-            schema={"symbol": pl.String, "quantity": pl.Float64, "avg_price": pl.Float64},
-        )
+        positions = _EMPTY_POSITIONS
 
         result = constructor.construct(signals, positions)
 
@@ -324,10 +318,7 @@ class TestTopNPortfolioConstructor:
             {"datetime": [], "symbol": [], "signal": []},
             schema={"datetime": pl.Datetime, "symbol": pl.String, "signal": pl.Float64},
         )
-        positions = pl.DataFrame(
-            {"symbol": [], "quantity": [], "avg_price": []},
-            schema={"symbol": pl.String, "quantity": pl.Float64, "avg_price": pl.Float64},
-        )
+        positions = _EMPTY_POSITIONS
 
         result = constructor.construct(signals, positions)
 
@@ -352,10 +343,7 @@ class TestTopNPortfolioConstructor:
                 "signal": [1.0, 2.0, 3.0],
             }
         )
-        positions = pl.DataFrame(
-            {"symbol": [], "quantity": [], "avg_price": []},
-            schema={"symbol": pl.String, "quantity": pl.Float64, "avg_price": pl.Float64},
-        )
+        positions = _EMPTY_POSITIONS
 
         result = constructor.construct(signals, positions)
 
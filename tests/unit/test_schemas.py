@@ -221,3 +221,18 @@ def test_metrics_schema_valid() -> None:
     )
     result = MetricsSchema.validate(df)
     assert result.equals(df)
+
+
+# VALIDATORS tests
+def test_validators_registry_maps_to_schema_validate() -> None:
+    """VALIDATORSの各エントリが対応するスキーマのvalidateを指す"""
+    from qeel.schemas import VALIDATORS
+    from qeel.schemas.validators import PositionSchema, SignalSchema
+
+    assert VALIDATORS["signal"] is SignalSchema.validate
+    assert VALIDATORS["position"] is PositionSchema.validate
+
+    df = pl.DataFrame({"datetime": [datetime(2023, 1, 1)], "symbol": ["AAPL"]})
+    assert VALIDATORS["signal"](df).equals(df)
+    with pytest.raises(ValueError, match="必須列が不足しています"):
+        VALIDATORS["position"](df)
@@ -406,10 +406,8 @@ class TestStrategyEngineSteps:
         mock_data_sources: dict[str, MockDataSource],
     ) -> None:
         """calculate_signalsステップが正しく動作すること"""
-        from qeel.models.context import Context
-
         target_date = datetime(2024, 1, 15)
-        strategy_engine._context = Context(current_datetime=target_date)
+        strategy_engine.reset_context(target_date)
 
         strategy_engine.run_step(target_date, StepName.CALCULATE_SIGNALS)
 
@@ -490,10 +488,8 @@ class TestStrategyEngineSteps:
         mock_exchange_client: MockExchangeClient,
     ) -> None:
         """create_exit_ordersステップが正しく動作すること"""
-        from qeel.models.context import Context
-
         target_date = datetime(2024, 1, 15)
-        strategy_engine._context = Context(current_datetime=target_date)
+        strategy_engine.reset_context(target_date)
 
         strategy_engine.run_step(target_date, StepName.CREATE_EXIT_ORDERS)
 
@@ -594,10 +590,8 @@ class TestStrategyEngineRunMethods:
         mock_signal_calculator: MockSignalCalculator,
     ) -> None:
         """run_stepが正しいメソッドにディスパッチすること"""
-        from qeel.models.context import Context
-
         target_date = datetime(2024, 1, 15)
-        strategy_engine._context = Context(current_datetime=target_date)
+        strategy_engine.reset_context(target_date)
 
         strategy_engine.run_step(target_date, StepName.CALCULATE_SIGNALS)
         assert mock_signal_calculator.call_count == 1
@@ -607,10 +601,8 @@ class TestStrategyEngineRunMethods:
         strategy_engine: "StrategyEngine",
     ) -> None:
         """不正なステップ名でValueErrorが発生すること"""
-        from qeel.models.context import Context
-
         target_date = datetime(2024, 1, 15)
-        strategy_engine._context = Context(current_datetime=target_date)
+        strategy_engine.reset_context(target_date)
 
         with pytest.raises(ValueError, match="不正なステップ名"):
             strategy_engine.run_step(target_date, "invalid_step")  # type: ignore
@@ -620,15 +612,41 @@ class TestStrategyEngineRunMethods:
         strategy_engine: "StrategyEngine",
     ) -> None:
         """run_stepがContextのcurrent_datetimeを設定すること"""
-        from qeel.models.context import Context
-
         target_date = datetime(2024, 1, 15)
-        strategy_engine._context = Context(current_datetime=datetime(2024, 1, 1))
+        strategy_engine.reset_context(datetime(2024, 1, 1))
 
         strategy_engine.run_step(target_date, StepName.CALCULATE_SIGNALS)
 
         assert strategy_engine._context.current_datetime == target_date
 
+    def test_reset_context_reuses_existing_context(
+        self,
+        strategy_engine: "StrategyEngine",
+    ) -> None:
+        """reset_contextが既存のContextを再利用し、各要素をクリアすること"""
+        first = strategy_engine.reset_context(datetime(2024, 1, 1))
+        assert strategy_engine._context is first
+
+        strategy_engine.run_step(datetime(2024, 1, 1), StepName.CALCULATE_SIGNALS)
+        assert strategy_engine._context is not None
+        assert strategy_engine._context.signals is not None
+
+        # run_step内のload_context()が設定したContextへの参照を保持しておく
+        context = strategy_engine._context
+        reset = strategy_engine.reset_context(datetime(2024, 1, 15))
+
+        assert reset is context
+        assert reset.current_datetime == datetime(2024, 1, 15)
+        assert reset.signals is None
+        assert reset.portfolio_plan is None
+        assert reset.entry_orders is None
+        assert reset.exit_orders is None
+        assert reset.current_positions is None
+
+        # 以前に保持していた参照もその場でクリアされている
+        assert context.current_datetime == datetime(2024, 1, 15)
+        assert context.signals is None
+
     def test_run_steps_executes_multiple_steps(
         self,
         strategy_engine: "StrategyEngine",
@@ -636,10 +654,8 @@ class TestStrategyEngineRunMethods:
         mock_portfolio_constructor: MockPortfolioConstructor,
     ) -> None:
         """run_stepsが複数ステップを順番に実行すること"""
-        from qeel.models.context import Context
-
         target_date = datetime(2024, 1, 15)
-        strategy_engine._context = Context(current_datetime=target_date)
+        strategy_engine.reset_context(target_date)
 
         strategy_engine.run_steps(
             target_date,
@@ -661,6 +677,26 @@ class TestStrategyEngineRunMethods:
 
         assert mock_signal_calculator.call_count == 0
 
+    def test_run_range_runs_each_iteration(
+        self,
+        strategy_engine: "StrategyEngine",
+        mock_signal_calculator: MockSignalCalculator,
+    ) -> None:
+        """run_rangeがloop.frequency間隔で終了日を含めて各iterationを実行すること"""
+        strategy_engine.run_range(datetime(2024, 1, 15), datetime(2024, 1, 17), [StepName.CALCULATE_SIGNALS])
+
+        assert mock_signal_calculator.call_count == 3
+        assert strategy_engine._context is not None
+        assert strategy_engine._context.current_datetime == datetime(2024, 1, 17)
+
+    def test_run_range_invalid_range_raises_value_error(
+        self,
+        strategy_engine: "StrategyEngine",
+    ) -> None:
+        """start_dateがend_dateより後の場合ValueErrorが発生すること"""
+        with pytest.raises(ValueError, match="start_date"):
+            strategy_engine.run_range(datetime(2024, 1, 17), datetime(2024, 1, 15), [StepName.CALCULATE_SIGNALS])
+
     def test_run_step_auto_loads_context(
         self,
         strategy_engine: "StrategyEngine",
@@ -853,7 +889,6 @@ class TestStrategyEngineErrorHandling:
     ) -> None:
         """データ取得失敗時にStrategyEngineErrorが発生すること"""
         from qeel.core.strategy_engine import StrategyEngine, StrategyEngineError
-        from qeel.models.context import Context
 
         # 失敗するデータソースを作成
         class FailingDataSource:
@@ -884,7 +919,7 @@ class TestStrategyEngineErrorHandling:
         )
 
         target_date = datetime(2024, 1, 15)
-        engine._context = Context(current_datetime=target_date)
+        engine.reset_context(target_date)
 
         with pytest.raises(StrategyEngineError) as exc_info:
             engine.run_step(target_date, StepName.CALCULATE_SIGNALS)
@@ -905,7 +940,6 @@ class TestStrategyEngineErrorHandling:
     ) -> None:
         """シグナル計算失敗時にStrategyEngineErrorが発生すること"""
         from qeel.core.strategy_engine import StrategyEngine, StrategyEngineError
-        from qeel.models.context import Context
 
         # 失敗するシグナル計算を作成
         class FailingSignalCalculator:
@@ -927,7 +961,7 @@ class TestStrategyEngineErrorHandling:
         )
 
         target_date = datetime(2024, 1, 15)
-        engine._context = Context(current_datetime=target_date)
+        engine.reset_context(target_date)
 
         with pytest.raises(StrategyEngineError) as exc_info:
             engine.run_step(target_date, StepName.CALCULATE_SIGNALS)
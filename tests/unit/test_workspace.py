@@ -40,3 +40,23 @@ def test_get_workspace_raises_when_path_not_exists(monkeypatch: pytest.MonkeyPat
 
     with pytest.raises(ValueError, match="QEEL_WORKSPACEで指定されたパスが存在しないか、ディレクトリではありません"):
         get_workspace()
+
+
+def test_get_workspace_caches_result(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    """結果がキャッシュされ、cache_clear()後に環境変数が再評価される"""
+    from qeel.utils.workspace import get_workspace
+
+    first = tmp_path / "first"
+    second = tmp_path / "second"
+    first.mkdir()
+    second.mkdir()
+
+    monkeypatch.setenv("QEEL_WORKSPACE", str(first))
+    assert get_workspace() == first
+
+    # キャッシュ済みのため環境変数の変更は反映されない
+    monkeypatch.setenv("QEEL_WORKSPACE", str(second))
+    assert get_workspace() == first
+
+    get_workspace.cache_clear()
+    assert get_workspace() == second